@@ -59,7 +59,7 @@ class ThresholdProcessor:
             >>> print(f"Image is grayscale: {processor.is_grayscale}")
         """
         self.image = image
-        self.is_grayscale = len(image.shape) == 2
+        self.is_grayscale = image.ndim == 2
 
     def convert_color_space(self, color_space: str) -> np.ndarray:
         """Convert the image to the specified color space.
@@ -131,13 +131,17 @@ class ThresholdProcessor:
             return cv2.cvtColor(bgr_image, cv2.COLOR_BGR2GRAY)
         return bgr_image
 
-    def apply_range_threshold(self, converted_image: np.ndarray, lower_bounds: List[int], upper_bounds: List[int]) -> np.ndarray:
+    def apply_range_threshold(self, converted_image: np.ndarray, lower_bounds: List[int], upper_bounds: List[int], dst: np.ndarray = None, mask: np.ndarray = None) -> np.ndarray:
         """Apply range-based thresholding to create a binary mask.
         
         This method creates a binary mask by applying lower and upper bounds
         to each channel of the input image. Pixels within the specified range
         are retained, while others are set to zero. This is commonly used for
-        color-based object segmentation.
+        color-based object segmentation. When the bounds of an 8-bit image
+        span 0-255 on every channel the mask would select every pixel, so the
+        image is copied without building the mask. For 8-bit images the mask
+        is applied with one broadcast AND that writes every output pixel, so
+        the result needs no zero-initialized buffer.
         
         Args:
             converted_image: Input image in any color space as numpy array.
@@ -145,6 +149,9 @@ class ThresholdProcessor:
                 Length must match the number of channels in the image.
             upper_bounds: List of upper threshold values for each channel.
                 Length must match the number of channels in the image.
+            dst: Optional output buffer of the same shape and dtype as the
+                processor's image, reused instead of allocating the result.
+            mask: Optional single-channel uint8 buffer for the range mask.
                 
         Returns:
             np.ndarray: Thresholded image where pixels within the range are preserved
@@ -159,11 +166,35 @@ class ThresholdProcessor:
             Time Complexity: O(n) where n is the number of pixels.
             Space Complexity: O(n) for the mask and result image.
         """
+        if (converted_image.dtype == np.uint8
+                and all(low <= 0 for low in lower_bounds)
+                and all(high >= 255 for high in upper_bounds)):
+            # Full range on every channel: one copy instead of inRange + bitwise_and
+            if self._fits(dst):
+                np.copyto(dst, self.image)
+                return dst
+            return self.image.copy()
+        
         lower_bounds = np.array(lower_bounds, dtype=np.uint8)
         upper_bounds = np.array(upper_bounds, dtype=np.uint8)
-        mask = cv2.inRange(converted_image, lower_bounds, upper_bounds)
+        mask = cv2.inRange(converted_image, lower_bounds, upper_bounds, dst=mask)
+        if self.image.dtype == np.uint8:
+            # The mask is 0 or 255, so AND-ing zeroes unselected pixels and keeps the rest
+            out = dst if self._fits(dst) else None
+            if self.image.ndim == 2:
+                # Same shape as the mask: OpenCV's dispatched SIMD kernel, no broadcast
+                return cv2.bitwise_and(self.image, mask, dst=out)
+            return np.bitwise_and(self.image, mask[..., None], out=out)
+        if self._fits(dst):
+            # Masked operations leave unselected pixels of dst untouched
+            dst.fill(0)
+            return cv2.bitwise_and(self.image, self.image, dst=dst, mask=mask)
         return cv2.bitwise_and(self.image, self.image, mask=mask)
 
+    def _fits(self, dst: np.ndarray) -> bool:
+        """Return True if dst can hold a result shaped like the processor's image."""
+        return dst is not None and dst.shape == self.image.shape and dst.dtype == self.image.dtype
+
     def apply_binary_threshold(self, gray_image: np.ndarray, threshold_value: int, use_otsu: bool) -> np.ndarray:
         """Apply binary thresholding to a grayscale image.
         
@@ -198,7 +229,88 @@ class ThresholdProcessor:
             ret, mask = cv2.threshold(gray_image, threshold_value, 255, cv2.THRESH_BINARY)
         return mask
     
-    def apply_advanced_threshold(self, gray_image: np.ndarray, threshold_value: int, max_value: int, threshold_type: str, use_otsu: bool = False, use_triangle: bool = False) -> np.ndarray:
+    @staticmethod
+    def compute_otsu_threshold(hist: np.ndarray) -> int:
+        """Compute Otsu's threshold from a 256-bin histogram.
+        
+        Uses the cumulative-sum form of the between-class variance,
+        (mu_T * w - mu)^2 / (w * (1 - w)), evaluated for all 256 candidate
+        thresholds at once. Picks the first maximum like cv2.THRESH_OTSU.
+        
+        Args:
+            hist: Pixel counts per gray level, e.g. from np.bincount(image.ravel(), minlength=256).
+                
+        Returns:
+            int: Threshold value; pixels greater than it belong to the upper class.
+            
+        Examples:
+            >>> hist = np.bincount(gray.ravel(), minlength=256)
+            >>> t = ThresholdProcessor.compute_otsu_threshold(hist)
+            >>> _, binary = cv2.threshold(gray, t, 255, cv2.THRESH_BINARY)
+            
+        Performance:
+            Time Complexity: O(256) - Independent of image size.
+            Space Complexity: O(256) for the cumulative sums.
+        """
+        prob = hist.astype(np.float64) / max(hist.sum(), 1)
+        omega = np.cumsum(prob)
+        mu = np.cumsum(prob * np.arange(256))
+        denom = omega * (1.0 - omega)
+        eps = np.finfo(np.float32).eps
+        valid = (np.minimum(omega, 1.0 - omega) >= eps)
+        sigma = np.zeros(256)
+        sigma[valid] = (mu[-1] * omega[valid] - mu[valid]) ** 2 / denom[valid]
+        return int(np.argmax(sigma))
+
+    @staticmethod
+    def compute_triangle_threshold(hist: np.ndarray) -> int:
+        """Compute the Triangle method threshold from a 256-bin histogram.
+        
+        Follows cv2.THRESH_TRIANGLE: draws a line from the histogram peak to
+        the far end of its longer tail and returns the gray level farthest
+        from that line, minus one.
+        
+        Args:
+            hist: Pixel counts per gray level, e.g. from np.bincount(image.ravel(), minlength=256).
+                
+        Returns:
+            int: Threshold value; pixels greater than it belong to the upper class.
+            
+        Examples:
+            >>> hist = np.bincount(gray.ravel(), minlength=256)
+            >>> t = ThresholdProcessor.compute_triangle_threshold(hist)
+            
+        Performance:
+            Time Complexity: O(256) - Independent of image size.
+            Space Complexity: O(256) for the histogram copy.
+        """
+        hist = np.asarray(hist, dtype=np.int64)
+        nonzero = np.flatnonzero(hist)
+        if nonzero.size == 0:
+            return 0
+        left_bound = max(int(nonzero[0]) - 1, 0)
+        right_bound = min(int(nonzero[-1]) + 1, 255)
+        max_ind = int(np.argmax(hist))
+        
+        flipped = max_ind - left_bound < right_bound - max_ind
+        if flipped:
+            hist = hist[::-1]
+            left_bound = 255 - right_bound
+            max_ind = 255 - max_ind
+        
+        thresh = left_bound
+        levels = np.arange(left_bound + 1, max_ind + 1)
+        if levels.size:
+            # Distance to the peak-to-tail line, up to a constant factor
+            dist = hist[max_ind] * levels + (left_bound - max_ind) * hist[levels]
+            best = int(np.argmax(dist))
+            if dist[best] > 0:
+                thresh = int(levels[best])
+        thresh -= 1
+        
+        return 255 - thresh if flipped else thresh
+
+    def apply_advanced_threshold(self, gray_image: np.ndarray, threshold_value: int, max_value: int, threshold_type: str, use_otsu: bool = False, use_triangle: bool = False, dst: np.ndarray = None) -> np.ndarray:
         """Apply advanced thresholding with multiple threshold types and automatic methods.
         
         This method provides access to all OpenCV thresholding types including
@@ -213,6 +325,8 @@ class ThresholdProcessor:
                 'BINARY', 'BINARY_INV', 'TRUNC', 'TOZERO', 'TOZERO_INV'
             use_otsu: If True, uses Otsu's method for automatic threshold selection.
             use_triangle: If True, uses Triangle method for automatic threshold selection.
+            dst: Optional output buffer from a previous call on an image of the
+                same size, passed through to cv2.threshold.
                 
         Returns:
             np.ndarray: Thresholded image with same dimensions as input.
@@ -245,10 +359,10 @@ class ThresholdProcessor:
             thresh_type += cv2.THRESH_TRIANGLE
             threshold_value = 0  # Triangle calculates automatically
             
-        ret, thresholded = cv2.threshold(gray_image, threshold_value, max_value, thresh_type)
+        ret, thresholded = cv2.threshold(gray_image, threshold_value, max_value, thresh_type, dst=dst)
         return thresholded
     
-    def apply_adaptive_threshold(self, gray_image: np.ndarray, max_value: int, adaptive_method: str, threshold_type: str, block_size: int, c_constant: int) -> np.ndarray:
+    def apply_adaptive_threshold(self, gray_image: np.ndarray, max_value: int, adaptive_method: str, threshold_type: str, block_size: int, c_constant: int, dst: np.ndarray = None) -> np.ndarray:
         """Apply adaptive thresholding for images with varying illumination.
         
         Adaptive thresholding calculates threshold values for local regions,
@@ -265,6 +379,8 @@ class ThresholdProcessor:
             block_size: Size of neighborhood area for threshold calculation.
                 Must be odd and >= 3. Even values are automatically incremented.
             c_constant: Constant subtracted from the calculated threshold.
+            dst: Optional output buffer from a previous call on an image of the
+                same size, passed through to cv2.adaptiveThreshold.
                 
         Returns:
             np.ndarray: Adaptively thresholded binary image.
@@ -300,7 +416,7 @@ class ThresholdProcessor:
         if block_size < 3:
             block_size = 3
             
-        thresholded = cv2.adaptiveThreshold(gray_image, max_value, method, thresh_type, block_size, c_constant)
+        thresholded = cv2.adaptiveThreshold(gray_image, max_value, method, thresh_type, block_size, c_constant, dst=dst)
         return thresholded
     
     def apply_multi_channel_threshold(self, converted_image: np.ndarray, thresholding_params: Dict[str, Any]) -> np.ndarray:
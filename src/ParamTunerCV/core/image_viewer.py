@@ -233,6 +233,8 @@ class ImageViewer:
         self.image_processing_func_internal: Optional[ImageProcessor] = None
         self._params_changed: bool = False
         self._cached_scaled_image = None
+        # (key, rows, cols) source indices of the visible pixels, see _process_image_for_display()
+        self._viewport_index = None
         self._cached_size_ratio = None
         self._cached_show_area = None
         self._event_handlers: Dict[str, List[Callable]] = {}
@@ -1057,8 +1059,6 @@ class ImageViewer:
                 except cv2.error: pass 
                 view_w, view_h = max(1, view_w), max(1, view_h)
 
-                scaled_image_for_roi = cv2.resize(display_image, (scaled_w, scaled_h), interpolation=cv2.INTER_NEAREST)
-                
                 max_show_x = max(0, scaled_w - view_w)
                 max_show_y = max(0, scaled_h - view_h)
                 self.show_area[0] = max(0, min(self.show_area[0], max_show_x))
@@ -1072,8 +1072,22 @@ class ImageViewer:
                     print(f"Error: Invalid ROI dimensions for view in '{name}'.")
                     return None
                 
-                image_roi_content = scaled_image_for_roi[roi_y_start : roi_y_start + roi_h_actual, \
-                                                         roi_x_start : roi_x_start + roi_w_actual]
+                if scaled_w == orig_w and scaled_h == orig_h:
+                    # Unscaled: the view is a plain slice (a view, no copy)
+                    image_roi_content = display_image[roi_y_start : roi_y_start + roi_h_actual, \
+                                                      roi_x_start : roi_x_start + roi_w_actual]
+                else:
+                    # Sample only the visible pixels, as cv2.resize(INTER_NEAREST) picks them
+                    key = (orig_w, orig_h, scaled_w, scaled_h,
+                           roi_x_start, roi_y_start, roi_w_actual, roi_h_actual)
+                    if self._viewport_index is None or self._viewport_index[0] != key:
+                        xs = (np.arange(roi_x_start, roi_x_start + roi_w_actual) * (orig_w / scaled_w)).astype(np.intp)
+                        ys = (np.arange(roi_y_start, roi_y_start + roi_h_actual) * (orig_h / scaled_h)).astype(np.intp)
+                        np.minimum(xs, orig_w - 1, out=xs)
+                        np.minimum(ys, orig_h - 1, out=ys)
+                        self._viewport_index = (key, ys[:, np.newaxis], xs)
+                    _, rows, cols = self._viewport_index
+                    image_roi_content = display_image[rows, cols]
 
                 if image_roi_content.size == 0:
                     print(f"Error: View ROI content is empty for '{name}'.")
@@ -137,7 +137,12 @@ class Tooltip:
             Time Complexity: O(1) - Widget creation and positioning operations.
             Space Complexity: O(1) - Single tooltip window creation.
         """
-        x, y, _, _ = self.widget.bbox("insert")
+        # Only text-like widgets have an "insert" index; for buttons and labels
+        # bbox() is the grid bbox and cannot be used to anchor the tooltip
+        bbox = None
+        if isinstance(self.widget, (tk.Text, tk.Entry, tk.Spinbox)):
+            bbox = self.widget.bbox("insert")
+        x, y = (bbox[0], bbox[1]) if bbox else (0, 0)
         x += self.widget.winfo_rootx() + 25
         y += self.widget.winfo_rooty() + 25
 
@@ -28,9 +28,203 @@ Usage:
     theme_manager.create_tooltip(widget, "Help text")
 """
 
+import collections
+import functools
+import sys
+import types
+import weakref
 import tkinter as tk
 from tkinter import ttk
 
+# Field order of a theme color scheme
+_ThemeColors = collections.namedtuple('_ThemeColors', [
+    'primary', 'secondary', 'bg', 'fg', 'frame_bg', 'button_fg', 'button_hover',
+    'tooltip_bg', 'tooltip_fg', 'tooltip_border', 'selection_bg', 'selection_fg',
+    'combobox_border', 'combobox_arrow',
+])
+
+# Theme color schemes. Internal code reads the namedtuples by attribute;
+# ThemeManager.theme exposes the matching read-only mapping, shared by
+# every instance.
+_LIGHT_COLORS = _ThemeColors(
+    primary='#007bff',
+    secondary='#6c757d',
+    bg='#f0f0f0',
+    fg='#000000',
+    frame_bg='#ffffff',
+    button_fg='#ffffff',
+    button_hover='#0056b3',
+    tooltip_bg='#ffffcc',
+    tooltip_fg='#000000',
+    tooltip_border='#999999',
+    selection_bg='#e2f0ff',
+    selection_fg='#000000',
+    combobox_border='#007bff',
+    combobox_arrow='#007bff',
+)
+
+_DARK_COLORS = _ThemeColors(
+    primary='#0d6efd',
+    secondary='#6c757d',
+    bg='#212529',
+    fg='#ffffff',
+    frame_bg='#343a40',
+    button_fg='#ffffff',
+    button_hover='#0b5ed7',
+    tooltip_bg='#333333',
+    tooltip_fg='#ffffff',
+    tooltip_border='#555555',
+    selection_bg='#375a7f',
+    selection_fg='#ffffff',
+    combobox_border='#0d6efd',
+    combobox_arrow='#0d6efd',
+)
+
+_LIGHT_THEME = types.MappingProxyType(_LIGHT_COLORS._asdict())
+_DARK_THEME = types.MappingProxyType(_DARK_COLORS._asdict())
+
+# Style names returned by the get_*_style getters, interned once so every
+# widget receives the identical string object
+_BUTTON_STYLE = sys.intern("TButton")
+_PRIMARY_BUTTON_STYLE = sys.intern("Primary.TButton")
+_SECONDARY_BUTTON_STYLE = sys.intern("Secondary.TButton")
+_ACTIVE_BUTTON_STYLE = sys.intern("Active.TButton")
+_FRAME_STYLE = sys.intern("TFrame")
+_LABEL_STYLE = sys.intern("TLabel")
+_HEADER_LABEL_STYLE = sys.intern("Header.TLabel")
+_COMBOBOX_STYLE = sys.intern("TCombobox")
+_ENHANCED_COMBOBOX_STYLE = sys.intern("Enhanced.TCombobox")
+
+_BUTTON_STYLES = {
+    "primary": _PRIMARY_BUTTON_STYLE,
+    "secondary": _SECONDARY_BUTTON_STYLE,
+    "active": _ACTIVE_BUTTON_STYLE,
+}
+_LABEL_STYLES = {
+    "header": _HEADER_LABEL_STYLE,
+}
+
+# Widget types that expose an "insert" cursor index usable with bbox();
+# ttk.Entry, ttk.Combobox and ttk.Spinbox derive from tk.Entry
+_INSERT_CURSOR_WIDGETS = (tk.Text, tk.Entry, tk.Spinbox)
+
+def _tcl_value(value) -> str:
+    """Format a style option value as a single Tcl word."""
+    if isinstance(value, (tuple, list)):
+        return "{" + " ".join(str(item) for item in value) + "}"
+    return str(value)
+
+
+def _build_style_script(spec) -> str:
+    """
+    Render style spec entries into one ttk::style Tcl script.
+    
+    Args:
+        spec (list): (method, style_name, options) tuples as built by
+                    ThemeManager; map options hold lists of (state, value) pairs.
+    
+    Returns:
+        str: Newline separated ttk::style configure/map commands.
+    """
+    commands = []
+    for method, style_name, options in spec:
+        if not options:
+            # "ttk::style configure NAME" without options is only a query
+            continue
+        parts = ["ttk::style", method, style_name]
+        for option, value in options.items():
+            if method == "map":
+                value = [item for state_spec in value for item in state_spec]
+            parts.append(f"-{option}")
+            parts.append(_tcl_value(value))
+        commands.append(" ".join(parts))
+    return "\n".join(commands)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_style_spec(colors, style_base: bool) -> list:
+    """
+    Build the (method, style_name, options) operations of a theme.
+    
+    Args:
+        colors (_ThemeColors): The color scheme to style widgets with.
+        style_base (bool): Whether to also restyle the "." base style, which the
+                          dark theme needs so unstyled ttk widgets turn dark too.
+    
+    Returns:
+        list: Style operations consumed by _build_style_script().
+    """
+    primary_color = colors.primary
+    secondary_color = colors.secondary
+    bg_color = colors.bg
+    fg_color = colors.fg
+    frame_bg_color = colors.frame_bg
+    button_fg_color = colors.button_fg
+    button_hover_color = colors.button_hover
+    selection_bg_color = colors.selection_bg
+    selection_fg_color = colors.selection_fg
+    spec = [
+        ("configure", "TFrame", {"background": frame_bg_color}),
+        ("configure", "TLabel", {"background": frame_bg_color, "foreground": fg_color}),
+        ("configure", "TButton", {}),
+        ("map", "TButton", {
+            "foreground": [('!active', button_fg_color)],
+            "background": [('!active', primary_color), ('active', button_hover_color)]}),
+
+        ("configure", "Header.TLabel", {"font": ("Helvetica", 12, "bold")}),
+        ("configure", "Primary.TButton", {}),
+        ("map", "Primary.TButton", {
+            "foreground": [('!active', button_fg_color)],
+            "background": [('!active', primary_color), ('active', button_hover_color)]}),
+
+        ("configure", "Secondary.TButton", {}),
+        ("map", "Secondary.TButton", {
+            "foreground": [('!active', button_fg_color)],
+            "background": [('!active', secondary_color), ('active', "#5a6268")]}),
+
+        # Active state button for drawing modes
+        ("configure", "Active.TButton", {}),
+        ("map", "Active.TButton", {
+            "foreground": [('!active', '#ffffff')],
+            "background": [('!active', '#28a745'), ('active', '#1e7e34')]}),  # Green for active
+    ]
+
+    if style_base:
+        spec.insert(0, ("configure", ".", {"background": bg_color, "foreground": fg_color,
+                                           "fieldbackground": frame_bg_color,
+                                           "bordercolor": secondary_color}))
+
+    # Standard and enhanced comboboxes share one palette; the enhanced
+    # variant only adds a flat border and focus/hover highlighting.
+    combobox_options = {
+        "background": frame_bg_color,
+        "foreground": fg_color,
+        "fieldbackground": frame_bg_color,
+        "selectbackground": selection_bg_color,
+        "selectforeground": selection_fg_color,
+        "arrowcolor": primary_color,
+        "bordercolor": primary_color}
+    combobox_maps = {
+        "fieldbackground": [('readonly', frame_bg_color)],
+        "selectbackground": [('readonly', selection_bg_color)],
+        "selectforeground": [('readonly', selection_fg_color)]}
+    for combobox_style, extra_options, extra_maps in (
+            ("TCombobox", {}, {}),
+            ("Enhanced.TCombobox",
+             {"relief": "flat", "borderwidth": 1},
+             {"bordercolor": [('focus', primary_color), ('hover', primary_color)]})):
+        spec.append(("configure", combobox_style, {**combobox_options, **extra_options}))
+        spec.append(("map", combobox_style, {**combobox_maps, **extra_maps}))
+    return spec
+
+
+# Palette per dark-mode flag: (theme mapping, colors namedtuple)
+_PALETTES = {
+    False: (_LIGHT_THEME, _LIGHT_COLORS),
+    True: (_DARK_THEME, _DARK_COLORS),
+}
+
+
 class ThemeManager:
     """
     Comprehensive theme and styling manager for tkinter interfaces.
@@ -45,10 +239,30 @@ class ThemeManager:
     types and states. It also includes a sophisticated tooltip system with
     theme-aware styling.
     
+    The ttk styling of each mode is rendered once per process, on first use,
+    into a Tcl script shared by every ThemeManager instance, so applying a
+    theme to a window (preview, dialogs) is a single tk.eval() call.
+    
     Attributes:
         use_dark_mode (bool): Whether dark theme is currently active.
-        theme (dict): Current theme color scheme with named color values.
-        _tooltip_windows (dict): Tracking dictionary for active tooltip windows.
+        theme (Mapping): Current theme color scheme with named color values.
+                         Read-only and shared between instances.
+        colors (namedtuple): The same scheme as a namedtuple for attribute
+                             access (e.g. colors.tooltip_bg).
+        _tooltip_windows (WeakKeyDictionary): Active tooltip windows keyed by widget.
+        _tooltip_pool (WeakKeyDictionary): Shared tooltip popup per root window, reused by
+                              every tooltip instead of a Toplevel per hover.
+        _tips (WeakKeyDictionary): Tooltip state (text, timing, pending timers)
+                                   keyed by widget, shared by the class-level bindings.
+        _bound_interps (WeakSet): Tk roots of the interpreters whose tooltip
+                                  bindtag handlers are installed.
+        _interp_modes (WeakKeyDictionary): Class-level dark-mode flag whose ttk
+                                           styles are applied, keyed by the Tk
+                                           root of each interpreter.
+        _root_modes (WeakKeyDictionary): Class-level dark-mode flag each window's
+                                         background was last styled for.
+        _script_cache (dict): Class-level cache of rendered Tcl style scripts
+                              keyed by dark-mode flag.
     
     Examples:
         >>> theme_manager = ThemeManager(use_dark_mode=True)
@@ -61,6 +275,14 @@ class ThemeManager:
         >>> theme_manager.create_tooltip(primary_button, "Performs primary action")
     """
 
+    # Rendered Tcl scripts keyed by dark-mode flag; a mode's spec and script
+    # are only generated the first time that mode is applied
+    _script_cache = {}
+    # ttk styles belong to the interpreter, not to a ThemeManager, so the
+    # applied state is shared by every instance
+    _interp_modes = weakref.WeakKeyDictionary()
+    _root_modes = weakref.WeakKeyDictionary()
+
     def __init__(self, use_dark_mode: bool = False) -> None:
         """
         Initialize the theme manager with the specified theme mode.
@@ -93,7 +315,18 @@ class ThemeManager:
         self.theme = {}
         # We will call configure_theme when a root window is available
         # to get the style object.
-        self._tooltip_windows = {}  # Store tooltip windows
+        # Visible tooltip per widget; weak so destroyed widgets are not kept alive
+        self._tooltip_windows = weakref.WeakKeyDictionary()
+        # Shared popup (window, frame, label, ...) per root, created lazily
+        self._tooltip_pool = weakref.WeakKeyDictionary()
+        # Per-widget tooltip state, dispatched from one class-level binding
+        self._tips = weakref.WeakKeyDictionary()
+        self._bindtag = f"ThemeTooltip{id(self)}"
+        # Interpreters whose bindtag handlers exist, keyed by their Tk root
+        self._bound_interps = weakref.WeakSet()
+        # Palette read by attribute in hot paths; tooltips use light colors
+        # until a theme is configured
+        self.colors = _LIGHT_COLORS
 
     def configure_theme(self, root) -> None:
         """
@@ -102,6 +335,9 @@ class ThemeManager:
         Applies the complete theme configuration to the provided root window,
         including widget styles, color schemes, and root window styling.
         Handles both light and dark theme configurations with fallback support.
+        When the interpreter's ttk styles already match the mode, by this or
+        any other ThemeManager, the style calls are skipped and only the root
+        window is restyled; a root already styled for the mode returns at once.
         
         Args:
             root: The root tkinter window to apply the theme to. Must be a valid
@@ -122,13 +358,34 @@ class ThemeManager:
             Time Complexity: O(1) - Fixed number of style configurations.
             Space Complexity: O(1) - Theme dictionary with fixed color entries.
         """
+        use_dark_mode = self.use_dark_mode
+        interp_root = root.nametowidget('.')
+        # The interpreter's ttk styles already match this mode
+        if self._interp_modes.get(interp_root) == use_dark_mode:
+            self.theme, self.colors = _PALETTES[use_dark_mode]
+            # Only a root not yet styled for the mode needs its background set
+            if self._root_modes.get(root) != use_dark_mode:
+                self.get_root_style(root)
+                self._root_modes[root] = use_dark_mode
+            return
+
         try:
             style = ttk.Style(root)
+        except tk.TclError as e:
+            # No usable ttk styling (e.g. headless runs): skip the style work
+            # but keep the palette so tooltips and color lookups still work
+            self.theme, self.colors = _PALETTES[self.use_dark_mode]
+            print(f"Theme configuration error: {e}")
+            return
+
+        try:
             if self.use_dark_mode:
                 self._configure_dark_theme(style)
             else:
                 self._configure_light_theme(style)
             self.get_root_style(root)
+            self._interp_modes[interp_root] = use_dark_mode
+            self._root_modes[root] = use_dark_mode
         except Exception as e:
             print(f"Theme configuration error: {e}")
             # Use minimal styling if advanced styling fails
@@ -161,99 +418,7 @@ class ThemeManager:
             Time Complexity: O(1) - Fixed number of style configurations.
             Space Complexity: O(1) - Fixed theme dictionary with predefined colors.
         """
-        # Colors
-        primary_color = "#007bff"
-        secondary_color = "#6c757d"
-        bg_color = "#f0f0f0"
-        fg_color = "#000000"
-        frame_bg_color = "#ffffff"
-        button_fg_color = "#ffffff"
-        button_hover_color = "#0056b3"
-        selection_bg_color = "#e2f0ff"
-        selection_fg_color = "#000000"
-        
-        # Store theme colors for later use
-        self.theme = {
-            'primary': primary_color,
-            'secondary': secondary_color,
-            'bg': bg_color,
-            'fg': fg_color,
-            'frame_bg': frame_bg_color,
-            'button_fg': button_fg_color,
-            'button_hover': button_hover_color,
-            'tooltip_bg': '#ffffcc',
-            'tooltip_fg': '#000000',
-            'tooltip_border': '#999999',
-            'selection_bg': selection_bg_color,
-            'selection_fg': selection_fg_color,
-            'combobox_border': primary_color,
-            'combobox_arrow': primary_color
-        }
-
-        # Style configurations
-        try:
-            style.theme_use('default')
-        except tk.TclError:
-            # A theme is not available, so we can't do much.
-            # This can happen in environments without full GUI support.
-            return
-
-        style.configure("TFrame", background=frame_bg_color)
-        style.configure("TLabel", background=frame_bg_color, foreground=fg_color)
-        style.configure("TButton")
-        style.map("TButton",
-                  foreground=[('!active', button_fg_color)],
-                  background=[('!active', primary_color), ('active', button_hover_color)])
-
-        # Configure combobox style
-        style.configure("TCombobox", 
-                        background=frame_bg_color,
-                        foreground=fg_color,
-                        fieldbackground=frame_bg_color,
-                        selectbackground=selection_bg_color,
-                        selectforeground=selection_fg_color,
-                        arrowcolor=primary_color,
-                        bordercolor=primary_color)
-        
-        style.map("TCombobox",
-                  fieldbackground=[('readonly', frame_bg_color)],
-                  selectbackground=[('readonly', selection_bg_color)],
-                  selectforeground=[('readonly', selection_fg_color)])
-                  
-        # Configure enhanced combobox style
-        style.configure("Enhanced.TCombobox", 
-                        relief="flat",
-                        borderwidth=1,
-                        background=frame_bg_color,
-                        foreground=fg_color,
-                        fieldbackground=frame_bg_color,
-                        selectbackground=selection_bg_color,
-                        selectforeground=selection_fg_color,
-                        arrowcolor=primary_color,
-                        bordercolor=primary_color)
-                        
-        style.map("Enhanced.TCombobox",
-                  fieldbackground=[('readonly', frame_bg_color)],
-                  selectbackground=[('readonly', selection_bg_color)],
-                  selectforeground=[('readonly', selection_fg_color)],
-                  bordercolor=[('focus', primary_color), ('hover', primary_color)])
-
-        style.configure("Header.TLabel", font=("Helvetica", 12, "bold"))
-        style.configure("Primary.TButton")
-        style.map("Primary.TButton",
-                  foreground=[('!active', button_fg_color)],
-                  background=[('!active', primary_color), ('active', button_hover_color)])
-
-        style.configure("Secondary.TButton")
-        style.map("Secondary.TButton",
-                  foreground=[('!active', button_fg_color)],
-                  background=[('!active', secondary_color), ('active', "#5a6268")])
-
-        # Active state button for drawing modes
-        style.configure("Active.TButton")
-        style.map("Active.TButton",
-                  foreground=[('!active', '#ffffff')],
-                  background=[('!active', '#28a745'), ('active', '#1e7e34')])  # Green for active
+        self._apply_palette(style, False)
 
     def _configure_dark_theme(self, style) -> None:
         """
@@ -283,100 +448,67 @@ class ThemeManager:
             Time Complexity: O(1) - Fixed number of style configurations.
             Space Complexity: O(1) - Fixed theme dictionary with predefined colors.
         """
-        # Colors
-        primary_color = "#0d6efd"
-        secondary_color = "#6c757d"
-        bg_color = "#212529"
-        fg_color = "#ffffff"
-        frame_bg_color = "#343a40"
-        button_fg_color = "#ffffff"
-        button_hover_color = "#0b5ed7"
-        selection_bg_color = "#375a7f"
-        selection_fg_color = "#ffffff"
-        
-        # Store theme colors for later use
-        self.theme = {
-            'primary': primary_color,
-            'secondary': secondary_color,
-            'bg': bg_color,
-            'fg': fg_color,
-            'frame_bg': frame_bg_color,
-            'button_fg': button_fg_color,
-            'button_hover': button_hover_color,
-            'tooltip_bg': '#333333',
-            'tooltip_fg': '#ffffff',
-            'tooltip_border': '#555555',
-            'selection_bg': selection_bg_color,
-            'selection_fg': selection_fg_color,
-            'combobox_border': primary_color,
-            'combobox_arrow': primary_color
-        }
+        self._apply_palette(style, True)
+
+    def _apply_palette(self, style, use_dark_mode: bool) -> None:
+        """
+        Select a theme's colors and apply its ttk styles.
+        
+        Shared body of _configure_light_theme() and _configure_dark_theme().
+        
+        Args:
+            style: The ttk.Style object to configure.
+            use_dark_mode (bool): Whether to apply the dark or the light theme.
+        
+        Returns:
+            None: Updates self.theme/self.colors and the ttk styles, no return value.
+            
+        Performance:
+            Time Complexity: O(1) - One theme_use call and one cached script eval.
+            Space Complexity: O(1) - Theme data is shared, not copied.
+        """
+        # Store theme colors for later use (shared, never mutated)
+        self.theme, self.colors = _PALETTES[use_dark_mode]
 
         # Style configurations
         try:
             style.theme_use('default')
         except tk.TclError:
+            # A theme is not available, so we can't do much.
+            # This can happen in environments without full GUI support.
             return
 
-        style.configure(".", background=bg_color, foreground=fg_color, fieldbackground=frame_bg_color, bordercolor=secondary_color)
-        style.configure("TFrame", background=frame_bg_color)
-        style.configure("TLabel", background=frame_bg_color, foreground=fg_color)
-        style.configure("TButton")
-        style.map("TButton",
-                  foreground=[('!active', button_fg_color)],
-                  background=[('!active', primary_color), ('active', button_hover_color)])
-                  
-        # Configure combobox style
-        style.configure("TCombobox", 
-                        background=frame_bg_color,
-                        foreground=fg_color,
-                        fieldbackground=frame_bg_color,
-                        selectbackground=selection_bg_color,
-                        selectforeground=selection_fg_color,
-                        arrowcolor=primary_color,
-                        bordercolor=primary_color)
-        
-        style.map("TCombobox",
-                  fieldbackground=[('readonly', frame_bg_color)],
-                  selectbackground=[('readonly', selection_bg_color)],
-                  selectforeground=[('readonly', selection_fg_color)])
-                  
-        # Configure enhanced combobox style
-        style.configure("Enhanced.TCombobox", 
-                        relief="flat",
-                        borderwidth=1,
-                        background=frame_bg_color,
-                        foreground=fg_color,
-                        fieldbackground=frame_bg_color,
-                        selectbackground=selection_bg_color,
-                        selectforeground=selection_fg_color,
-                        arrowcolor=primary_color,
-                        bordercolor=primary_color)
-                        
-        style.map("Enhanced.TCombobox",
-                  fieldbackground=[('readonly', frame_bg_color)],
-                  selectbackground=[('readonly', selection_bg_color)],
-                  selectforeground=[('readonly', selection_fg_color)],
-                  bordercolor=[('focus', primary_color), ('hover', primary_color)])
-
-        style.configure("Header.TLabel", font=("Helvetica", 12, "bold"))
-        style.configure("Primary.TButton")
-        style.map("Primary.TButton",
-                  foreground=[('!active', button_fg_color)],
-                  background=[('!active', primary_color), ('active', button_hover_color)])
-
-        style.configure("Secondary.TButton")
-        style.map("Secondary.TButton",
-                  foreground=[('!active', button_fg_color)],
-                  background=[('!active', secondary_color), ('active', "#5a6268")])
+        style.tk.eval(self._style_script(use_dark_mode))
 
-        # Active state button for drawing modes
-        style.configure("Active.TButton")
-        style.map("Active.TButton",
-                  foreground=[('!active', '#ffffff')],
-                  background=[('!active', '#28a745'), ('active', '#1e7e34')])  # Green for active
+    @classmethod
+    def _style_script(cls, use_dark_mode: bool) -> str:
+        """
+        Get the Tcl script that applies a theme's styles.
+        
+        Nothing is generated at import: the spec of a mode is built the first
+        time that mode is applied, and its script is rendered once and cached,
+        so a session that never uses a mode never pays for it.
+        
+        Args:
+            use_dark_mode (bool): Whether to return the dark theme script.
+        
+        Returns:
+            str: ttk::style commands ready for a single tk.eval() call.
+            
+        Performance:
+            Time Complexity: O(1) for cached scripts, O(n) to render a mode's
+                           script where n is the number of style operations.
+            Space Complexity: O(n) - One cached script per mode.
+        """
+        script = cls._script_cache.get(use_dark_mode)
+        if script is None:
+            spec = _build_style_spec(_PALETTES[use_dark_mode][1], use_dark_mode)
+            script = _build_style_script(spec)
+            cls._script_cache[use_dark_mode] = script
+        return script
 
-    def get_button_style(self, button_type: str = "default") -> str:
+    @staticmethod
+    def get_button_style(button_type: str = "default") -> str:
         """
         Get the appropriate ttk button style name based on the button type.
         
@@ -405,18 +537,13 @@ class ThemeManager:
             >>> print(active_style)  # "Active.TButton"
             
         Performance:
-            Time Complexity: O(1) - Simple string comparison and return.
+            Time Complexity: O(1) - Single dictionary lookup.
             Space Complexity: O(1) - No additional memory allocation.
         """
-        if button_type == "primary":
-            return "Primary.TButton"
-        if button_type == "secondary":
-            return "Secondary.TButton"
-        if button_type == "active":
-            return "Active.TButton"
-        return "TButton"
+        return _BUTTON_STYLES.get(button_type, _BUTTON_STYLE)
 
-    def get_frame_style(self, frame_type: str = "default") -> str:
+    @staticmethod
+    def get_frame_style(frame_type: str = "default") -> str:
         """
         Get the appropriate ttk frame style name based on the frame type.
         
@@ -444,9 +571,10 @@ class ThemeManager:
             Time Complexity: O(1) - Direct string return.
             Space Complexity: O(1) - No additional memory allocation.
         """
-        return "TFrame"
+        return _FRAME_STYLE
         
-    def get_label_style(self, label_type: str = "default") -> str:
+    @staticmethod
+    def get_label_style(label_type: str = "default") -> str:
         """
         Get the appropriate ttk label style name based on the label type.
         
@@ -473,14 +601,13 @@ class ThemeManager:
             >>> print(normal_style)  # "TLabel"
             
         Performance:
-            Time Complexity: O(1) - Simple string comparison and return.
+            Time Complexity: O(1) - Single dictionary lookup.
             Space Complexity: O(1) - No additional memory allocation.
         """
-        if label_type == "header":
-            return "Header.TLabel"
-        return "TLabel"
+        return _LABEL_STYLES.get(label_type, _LABEL_STYLE)
         
-    def get_combobox_style(self, enhanced: bool = True) -> str:
+    @staticmethod
+    def get_combobox_style(enhanced: bool = True) -> str:
         """
         Get the appropriate ttk combobox style name.
         
@@ -512,8 +639,8 @@ class ThemeManager:
             Space Complexity: O(1) - No additional memory allocation.
         """
         if enhanced:
-            return "Enhanced.TCombobox"
-        return "TCombobox"
+            return _ENHANCED_COMBOBOX_STYLE
+        return _COMBOBOX_STYLE
 
     def get_root_style(self, root) -> None:
         """
@@ -584,7 +711,8 @@ class ThemeManager:
         Attaches a sophisticated tooltip system to the specified widget that
         displays helpful text on hover. The tooltip uses theme-appropriate
         colors and includes smart positioning, timing controls, and proper
-        cleanup. Prevents duplicate tooltips on the same widget.
+        cleanup. Calling it again for the same widget updates the text and
+        timing of the existing tooltip instead of adding another one.
         
         Args:
             widget: The tkinter widget to attach the tooltip to. Can be any tkinter
@@ -592,9 +720,11 @@ class ThemeManager:
             text (str): The help text to display in the tooltip. Multi-line text
                        is supported with \n characters.
             delay (int): Delay in milliseconds before showing the tooltip after
-                        mouse enter. Must be >= 0. Defaults to 500ms.
+                        mouse enter. Must be >= 0; 0 shows the tooltip on the next
+                        idle cycle. Defaults to 500ms.
             duration (int): Duration in milliseconds to show tooltip. Set to 0 for
-                          indefinite display until mouse leave. Defaults to 5000ms.
+                          indefinite display until mouse leave, in which case no
+                          hide timer is scheduled. Defaults to 5000ms.
         
         Returns:
             None: Configures tooltip system as side effect, no return value.
@@ -615,88 +745,262 @@ class ThemeManager:
             >>> theme_mgr.create_tooltip(button, "Always visible", duration=0)
             
         Performance:
-            Time Complexity: O(1) - Constant time tooltip creation and event binding.
+            Time Complexity: O(1) - Constant time tooltip registration; the event
+                           handlers are bound once per interpreter on a shared bindtag,
+                           so no Tcl command is created per widget.
             Space Complexity: O(1) - Single tooltip window per widget stored in dict.
         """
-        # Ensure we don't have multiple tooltips for the same widget
-        if widget in self._tooltip_windows:
+        # A widget is bound only once; registering it again just updates the
+        # tooltip so bindings never accumulate across UI rebuilds.
+        tip = self._tips.get(widget)
+        if tip is not None:
+            tip.update(text=text, delay=delay, duration=duration)
             return
+
+        # Decide once whether the widget supports bbox("insert") rather than
+        # probing (and catching TclError) on every hover.
+        has_insert = isinstance(widget, _INSERT_CURSOR_WIDGETS)
+
+        self._tips[widget] = {
+            'text': text,
+            'delay': delay,
+            'duration': duration,
+            'has_insert': has_insert,
+            'after_id': None,  # Pending show timer
+            'hide_id': None,  # Pending auto-hide timer
+        }
+
+        # Route events through the shared bindtag instead of per-widget handlers
+        interp_root = widget.nametowidget('.')
+        if interp_root not in self._bound_interps:
+            widget.bind_class(self._bindtag, "<Enter>", self._on_enter)
+            widget.bind_class(self._bindtag, "<Leave>", self._on_leave)
+            widget.bind_class(self._bindtag, "<ButtonPress>", self._on_leave)  # Hide on click
+            widget.bind_class(self._bindtag, "<Destroy>", self._on_destroy)
+            self._bound_interps.add(interp_root)
+        widget.bindtags(widget.bindtags() + (self._bindtag,))
+
+    def _show_tooltip(self, widget) -> None:
+        """
+        Display the tooltip registered for a widget.
+        
+        Uses the popup shared by all tooltips of the widget's root window,
+        building it on first use. Afterwards only the position, text and
+        colors that changed are updated before it is deiconified.
+        
+        Args:
+            widget: A widget previously registered with create_tooltip().
+        
+        Returns:
+            None: Shows the tooltip window as side effect, no return value.
             
-        def enter(event):
-            # Schedule tooltip to appear after delay
-            widget._tooltip_id = widget.after(delay, lambda: show_tooltip(event))
-            
-        def leave(event):
-            # Cancel scheduled tooltip safely
-            if hasattr(widget, '_tooltip_id') and widget._tooltip_id is not None:
-                try:
-                    widget.after_cancel(widget._tooltip_id)
-                except (ValueError, tk.TclError):
-                    # Timer ID is no longer valid (already executed or cancelled)
-                    pass
-                widget._tooltip_id = None
-            # Hide tooltip if it's visible
-            hide_tooltip()
-            
-        def show_tooltip(event):
-            # Clear timer ID since tooltip is now being shown
-            if hasattr(widget, '_tooltip_id'):
-                widget._tooltip_id = None
-                
-            # Get screen position safely
-            try:
-                # Try to get cursor position from bbox if supported
-                bbox = widget.bbox("insert")
-                if bbox:
-                    x, y, _, _ = bbox
-                    x += widget.winfo_rootx() + 25
-                    y += widget.winfo_rooty() + 25
-                else:
-                    raise tk.TclError("bbox not supported")
-            except (tk.TclError, AttributeError):
-                # Fallback to widget position if bbox not supported
-                x = widget.winfo_rootx() + 25
-                y = widget.winfo_rooty() + 25
+        Performance:
+            Time Complexity: O(1) - Fixed number of Tk calls per show.
+            Space Complexity: O(1) - Popup widgets are created once per root window.
+        """
+        tip = self._tips.get(widget)
+        if tip is None:
+            return
+        # Clear timer ID since tooltip is now being shown
+        tip['after_id'] = None
+        # A re-show restarts the auto-hide countdown
+        self._cancel_hide_timer(widget, tip)
             
+        # Only text-like widgets have an "insert" index to anchor to
+        bbox = widget.bbox("insert") if tip['has_insert'] else None
+        if bbox:
+            x, y, _, _ = bbox
+            x += widget.winfo_rootx() + 25
+            y += widget.winfo_rooty() + 25
+        else:
+            x = widget.winfo_rootx() + 25
+            y = widget.winfo_rooty() + 25
+        
+        # Configure tooltip appearance
+        colors = self.colors
+        tooltip_bg = colors.tooltip_bg
+        tooltip_fg = colors.tooltip_fg
+        tooltip_border = colors.tooltip_border
+
+        # One popup per root is shared by all tooltipped widgets; it is built
+        # on first show and afterwards only updated, moved and re-shown.
+        root = widget.nametowidget('.')
+        popup = self._tooltip_pool.get(root)
+        if popup is None or not popup['window'].winfo_exists():
             # Create tooltip window
-            tooltip_window = tk.Toplevel(widget)
+            tooltip_window = tk.Toplevel(root)
             tooltip_window.wm_overrideredirect(True)  # Remove window decorations
             tooltip_window.wm_geometry(f"+{x}+{y}")
             
-            # Configure tooltip appearance
-            tooltip_bg = self.theme.get('tooltip_bg', '#ffffcc')
-            tooltip_fg = self.theme.get('tooltip_fg', '#000000')
-            tooltip_border = self.theme.get('tooltip_border', '#999999')
-            
             # Create tooltip frame with border
-            frame = tk.Frame(tooltip_window, 
-                             background=tooltip_border,
-                             borderwidth=1)
-            frame.pack(fill="both", expand=True)
+            tooltip_frame = tk.Frame(tooltip_window, 
+                                     background=tooltip_border,
+                                     borderwidth=1)
+            tooltip_frame.pack(fill="both", expand=True)
             
             # Create tooltip label
-            label = tk.Label(frame, 
-                            text=text, 
-                            background=tooltip_bg,
-                            foreground=tooltip_fg,
-                            justify=tk.LEFT,
-                            padx=5,
-                            pady=3)
-            label.pack()
+            tooltip_label = tk.Label(tooltip_frame, 
+                                     text=tip['text'], 
+                                     background=tooltip_bg,
+                                     foreground=tooltip_fg,
+                                     justify=tk.LEFT,
+                                     padx=5,
+                                     pady=3)
+            tooltip_label.pack()
+            self._tooltip_pool[root] = {
+                'window': tooltip_window,
+                'frame': tooltip_frame,
+                'label': tooltip_label,
+                'text': tip['text'],
+                'colors': colors,
+                'xy': (x, y),
+            }
+        else:
+            tooltip_window = popup['window']
+            # Only touch the window geometry when the position moved
+            if (x, y) != popup['xy']:
+                tooltip_window.wm_geometry(f"+{x}+{y}")
+                popup['xy'] = (x, y)
+            if tip['text'] != popup['text']:
+                popup['label'].configure(text=tip['text'])
+                popup['text'] = tip['text']
+            # Re-color only if the theme changed since the last show
+            if colors is not popup['colors']:
+                popup['frame'].configure(background=tooltip_border)
+                popup['label'].configure(background=tooltip_bg, foreground=tooltip_fg)
+                popup['colors'] = colors
+            tooltip_window.deiconify()
+            tooltip_window.lift()
+        
+        # Store the tooltip window
+        self._tooltip_windows[widget] = tooltip_window
+        
+        # Auto-hide tooltip after duration; duration <= 0 keeps it until leave
+        if tip['duration'] > 0:
+            tip['hide_id'] = widget.after(tip['duration'], self._hide_tooltip, widget)
+            
+    def _hide_tooltip(self, widget) -> None:
+        """
+        Hide the visible tooltip of a widget, keeping the shared popup for reuse.
+        
+        Args:
+            widget: A widget previously registered with create_tooltip().
+        
+        Returns:
+            None: Withdraws the tooltip window as side effect, no return value.
+            
+        Performance:
+            Time Complexity: O(1) - Single dictionary pop and withdraw call.
+            Space Complexity: O(1) - No additional memory allocation.
+        """
+        tip = self._tips.get(widget)
+        if tip is not None:
+            self._cancel_hide_timer(widget, tip)
+        tooltip_window = self._tooltip_windows.pop(widget, None)
+        if tooltip_window is not None and tooltip_window.winfo_exists():
+            tooltip_window.withdraw()
+
+    @staticmethod
+    def _cancel_hide_timer(widget, tip: dict) -> None:
+        """
+        Cancel the pending auto-hide timer of a tooltip, if any.
+        
+        Args:
+            widget: The widget the tooltip belongs to.
+            tip (dict): The widget's tooltip state from create_tooltip().
+        
+        Returns:
+            None: Cancels the timer as side effect, no return value.
+        """
+        hide_id = tip['hide_id']
+        tip['hide_id'] = None
+        if hide_id:
+            try:
+                widget.after_cancel(hide_id)
+            except (ValueError, tk.TclError):
+                # Timer already ran or the widget is gone
+                pass
+
+    def _on_enter(self, event) -> None:
+        """
+        Schedule the tooltip of the hovered widget after its configured delay.
+        
+        Shared <Enter> handler for every widget registered via create_tooltip().
+        
+        Args:
+            event: The tkinter <Enter> event; event.widget identifies the tooltip.
+        
+        Returns:
+            None: Schedules the tooltip as side effect, no return value.
             
-            # Store the tooltip window
-            self._tooltip_windows[widget] = tooltip_window
+        Performance:
+            Time Complexity: O(1) - Single dictionary lookup and timer scheduling.
+            Space Complexity: O(1) - One timer id stored per hovered widget.
+        """
+        widget = event.widget
+        if isinstance(widget, str):
+            return
+        tip = self._tips.get(widget)
+        if tip is None:
+            return
+        # Schedule tooltip to appear after delay; zero-delay tooltips go
+        # through the idle queue instead of a timer round-trip
+        delay = tip['delay']
+        if delay <= 0:
+            tip['after_id'] = widget.after_idle(self._show_tooltip, widget)
+        else:
+            tip['after_id'] = widget.after(delay, self._show_tooltip, widget)
+
+    def _on_leave(self, event) -> None:
+        """
+        Cancel a pending tooltip and hide the visible one for the left widget.
+        
+        Shared <Leave>/<ButtonPress> handler for every widget registered via
+        create_tooltip().
+        
+        Args:
+            event: The tkinter event; event.widget identifies the tooltip.
+        
+        Returns:
+            None: Cancels/hides the tooltip as side effect, no return value.
             
-            # Auto-hide tooltip after duration (if specified)
-            if duration > 0:
-                widget.after(duration, hide_tooltip)
-                
-        def hide_tooltip():
-            if widget in self._tooltip_windows:
-                self._tooltip_windows[widget].destroy()
-                del self._tooltip_windows[widget]
-        
-        # Bind events to widget
-        widget.bind("<Enter>", enter)
-        widget.bind("<Leave>", leave)
-        widget.bind("<ButtonPress>", leave)  # Hide on click
\ No newline at end of file
+        Performance:
+            Time Complexity: O(1) - Dictionary lookups and a timer cancel.
+            Space Complexity: O(1) - No additional memory allocation.
+        """
+        widget = event.widget
+        if isinstance(widget, str):
+            return
+        tip = self._tips.get(widget)
+        if tip is None:
+            return
+        # Cancel scheduled tooltip safely
+        after_id = tip['after_id']
+        tip['after_id'] = None
+        if after_id:
+            try:
+                widget.after_cancel(after_id)
+            except (ValueError, tk.TclError):
+                # Timer ID is no longer valid (already executed or cancelled)
+                pass
+        # Hide tooltip if it's visible
+        self._hide_tooltip(widget)
+
+    def _on_destroy(self, event) -> None:
+        """
+        Drop the tooltip state of a widget that is being destroyed.
+        
+        Clears any pending timer and the visible-tooltip entry so a destroyed
+        widget is never shown or kept alive by the manager.
+        
+        Args:
+            event: The tkinter <Destroy> event for a tooltipped widget.
+        
+        Returns:
+            None: Removes tooltip state as side effect, no return value.
+        """
+        widget = event.widget
+        if isinstance(widget, str):
+            return
+        self._tips.pop(widget, None)
+        self._tooltip_windows.pop(widget, None)
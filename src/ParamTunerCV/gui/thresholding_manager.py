@@ -31,6 +31,7 @@ Supported Color Spaces:
 Dependencies:
     - ThresholdingWindow: Individual thresholding window implementation
     - tkinter: GUI framework for error handling
+    - cv2: OpenCV window control for legacy thresholding windows
 
 Usage:
     threshold_manager = ThresholdingManager(viewer)
@@ -38,9 +39,10 @@ Usage:
     threshold_manager.update_all_thresholds()
 """
 
-from .thresholding_window import ThresholdingWindow
+from .thresholding_window import ThresholdingWindow, COLOR_SPACES
+from functools import partial
 import tkinter as tk
-from tkinter import ttk
+import cv2
 
 class ThresholdingManager:
     """
@@ -60,7 +62,7 @@ class ThresholdingManager:
         thresholding_windows (dict): Dictionary of active legacy thresholding windows
                                    keyed by color space name.
         unified_window: Reference to the unified thresholding window interface.
-        color_spaces (list): List of supported color space names for thresholding.
+        color_spaces (tuple): Supported color space names for thresholding.
     
     Examples:
         >>> manager = ThresholdingManager(image_viewer)
@@ -73,6 +75,8 @@ class ThresholdingManager:
         >>> manager.update_all_thresholds()
         # Updates all active thresholding windows
     """
+    __slots__ = ('viewer', 'thresholding_windows', 'unified_window', 'color_spaces')
+
     def __init__(self, viewer) -> None:
         """
         Initialize the thresholding manager with viewer reference.
@@ -95,14 +99,16 @@ class ThresholdingManager:
             >>> threshold_mgr = ThresholdingManager(viewer)
             >>> print(len(threshold_mgr.color_spaces))  # 8
             >>> print(threshold_mgr.thresholding_windows)  # {}
+            >>> print(threshold_mgr.unified_window)  # None
             
         Performance:
-            Time Complexity: O(1) - Simple initialization with fixed list creation.
-            Space Complexity: O(1) - Fixed memory for color space list and dictionaries.
+            Time Complexity: O(1) - Simple initialization, color spaces are shared.
+            Space Complexity: O(1) - Fixed memory for dictionaries.
         """
         self.viewer = viewer
         self.thresholding_windows = {}
-        self.color_spaces = ["BGR", "HSV", "HLS", "Lab", "Luv", "YCrCb", "XYZ", "Grayscale"]
+        self.unified_window = None
+        self.color_spaces = COLOR_SPACES
 
     def open_colorspace_selection_window(self) -> None:
         """
@@ -110,6 +116,7 @@ class ThresholdingManager:
         
         Creates or brings to front a comprehensive thresholding interface that
         combines color space selection with parameter controls in a single window.
+        A unified window hidden by closing it is shown again instead of rebuilt.
         Automatically detects whether the current image is grayscale or color
         and sets appropriate default color space.
         
@@ -138,18 +145,18 @@ class ThresholdingManager:
             return
             
         # Check if unified window already exists
-        if hasattr(self, 'unified_window') and self.unified_window:
+        if self.unified_window:
             try:
-                if hasattr(self.unified_window, 'root') and self.unified_window.root:
-                    self.unified_window.root.lift()
+                if self.unified_window.root:
+                    self.unified_window.show()
                     return
             except tk.TclError:
                 self.unified_window = None
         
         # Determine default colorspace based on image type
         current_idx = self.viewer.trackbar.parameters.get('show', 0)
-        image, _ = self.viewer._internal_images[current_idx]
-        is_grayscale = len(image.shape) == 2
+        image = self.viewer._internal_images[current_idx][0]
+        is_grayscale = image.ndim == 2
         
         # Set default colorspace but don't pre-select it
         default_colorspace = "Grayscale" if is_grayscale else "BGR"
@@ -158,7 +165,9 @@ class ThresholdingManager:
         self.unified_window = ThresholdingWindow(self.viewer, default_colorspace)
         self.unified_window.create_unified_window()  # Create unified window with both colorspace and parameters
         # Set up cleanup callback
-        self.unified_window.set_close_callback(lambda: self._on_unified_window_closed())
+        self.unified_window.set_close_callback(self._on_unified_window_closed)
+        # Closing only hides the window so re-opening skips widget creation
+        self.unified_window.root.protocol("WM_DELETE_WINDOW", self.unified_window.hide)
 
     def open_thresholding_window(self, color_space: str) -> None:
         """
@@ -194,27 +203,22 @@ class ThresholdingManager:
             Space Complexity: O(1) - Single window instance per color space.
         """
         # Check if window for this colorspace already exists and is valid
-        if color_space in self.thresholding_windows:
-            window = self.thresholding_windows[color_space]
-            if window and window.window_created:
-                try:
-                    # Bring existing OpenCV windows to front
-                    import cv2
-                    cv2.setWindowProperty(window.threshold_viewer.config.process_window_name, cv2.WND_PROP_TOPMOST, 1)
-                    cv2.setWindowProperty(window.threshold_viewer.config.process_window_name, cv2.WND_PROP_TOPMOST, 0)
-                    return  # Successfully brought existing window to front
-                except:
-                    # Window was destroyed, remove from dictionary
-                    del self.thresholding_windows[color_space]
-            else:
-                # Window is invalid, remove from dictionary
-                del self.thresholding_windows[color_space]
+        window = self.thresholding_windows.get(color_space)
+        if window and window.window_created:
+            try:
+                # Bring existing OpenCV windows to front
+                cv2.setWindowProperty(window.threshold_viewer.config.process_window_name, cv2.WND_PROP_TOPMOST, 1)
+                cv2.setWindowProperty(window.threshold_viewer.config.process_window_name, cv2.WND_PROP_TOPMOST, 0)
+                return  # Successfully brought existing window to front
+            except cv2.error:
+                pass  # Window was destroyed by the user
+        # A stale entry is replaced by the window registered below
         
         # Create new simple thresholding window (only OpenCV windows)
         window = ThresholdingWindow(self.viewer, color_space)
         window.create_simple_threshold_viewer()  # Only create OpenCV windows
         # Set up cleanup callback
-        window.set_close_callback(lambda: self._on_window_closed(color_space))
+        window.set_close_callback(partial(self._on_window_closed, color_space))
         self.thresholding_windows[color_space] = window
 
     def _on_window_closed(self, color_space: str) -> None:
@@ -241,11 +245,10 @@ class ThresholdingManager:
             >>> print("HSV" in threshold_mgr.thresholding_windows)  # False
             
         Performance:
-            Time Complexity: O(1) - Dictionary key deletion operation.
+            Time Complexity: O(1) - Single dictionary pop.
             Space Complexity: O(1) - No additional memory allocation.
         """
-        if color_space in self.thresholding_windows:
-            del self.thresholding_windows[color_space]
+        self.thresholding_windows.pop(color_space, None)
 
     def _on_unified_window_closed(self) -> None:
         """
@@ -264,7 +267,7 @@ class ThresholdingManager:
         Examples:
             >>> threshold_mgr = ThresholdingManager(viewer)
             >>> threshold_mgr.open_colorspace_selection_window()
-            >>> print(hasattr(threshold_mgr, 'unified_window'))  # True
+            >>> print(threshold_mgr.unified_window is not None)  # True
             >>> # User closes unified window, callback automatically called
             >>> threshold_mgr._on_unified_window_closed()
             >>> print(threshold_mgr.unified_window)  # None
@@ -273,8 +276,7 @@ class ThresholdingManager:
             Time Complexity: O(1) - Simple attribute clearing operation.
             Space Complexity: O(1) - No additional memory allocation.
         """
-        if hasattr(self, 'unified_window'):
-            self.unified_window = None
+        self.unified_window = None
 
     def cleanup_windows(self) -> None:
         """
@@ -306,10 +308,10 @@ class ThresholdingManager:
             Space Complexity: O(1) - No additional memory allocation during cleanup.
         """
         # Clean up unified window if it exists
-        if hasattr(self, 'unified_window') and self.unified_window:
+        if self.unified_window:
             try:
                 self.unified_window.destroy_window()
-            except:
+            except tk.TclError:
                 pass
             self.unified_window = None
         
@@ -319,7 +321,7 @@ class ThresholdingManager:
                 window.destroy_window()
         self.thresholding_windows.clear()
 
-    def update_all_thresholds(self) -> None:
+    def update_all_thresholds(self, force: bool = False) -> None:
         """
         Update threshold processing in all active thresholding windows.
         
@@ -328,8 +330,13 @@ class ThresholdingManager:
         This ensures all thresholding interfaces stay synchronized with
         changes in the main image or parameters.
         
+        Every window still skips its own update when its settings and source
+        image are unchanged, see ThresholdingWindow.update_threshold().
+        
         Args:
-            None: This method takes no arguments.
+            force (bool): Make every window recompute even if its settings and
+                         source are unchanged, e.g. after modifying an image
+                         array in place. Defaults to False.
         
         Returns:
             None: Updates all active windows as side effect, no return value.
@@ -353,10 +360,11 @@ class ThresholdingManager:
             Space Complexity: O(1) - No additional memory allocation during updates.
         """
         # Update the unified window if it exists
-        if hasattr(self, 'unified_window') and self.unified_window and self.unified_window.window_created:
-            self.unified_window.update_threshold()
+        if self.unified_window and self.unified_window.window_created:
+            self.unified_window.update_threshold(force=force)
         
         # Update all active legacy thresholding windows
-        for window in list(self.thresholding_windows.values()):
+        # update_threshold() never opens or closes windows, so iterate in place
+        for window in self.thresholding_windows.values():
             if window and window.window_created:
-                window.update_threshold()
+                window.update_threshold(force=force)
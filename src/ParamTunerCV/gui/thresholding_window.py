@@ -60,12 +60,156 @@ import tkinter as tk
 from tkinter import ttk, filedialog
 import cv2
 import numpy as np
+import collections
 import json
+import logging
+import queue
+import threading
+import time
+import traceback
+import types
 from ..analysis.threshold.image_processor import ThresholdProcessor
 from ..controls.trackbar_manager import TrackbarManager, make_trackbar
 from ..config.viewer_config import ViewerConfig
 from .theme_manager import ThemeManager
 
+logger = logging.getLogger(__name__)
+
+# Longest side of the downscaled proxy thresholded while a trackbar is moving
+PREVIEW_MAX_DIM = 512
+
+# Milliseconds without trackbar changes before the full-resolution update
+SETTLE_DELAY_MS = 250
+
+# Minimum seconds between threshold viewer refreshes while panning (~60 FPS)
+PAN_REFRESH_INTERVAL = 0.016
+
+# Shared read-only image shown by the threshold viewer when there is nothing to display
+_PLACEHOLDER_IMAGE = np.zeros((100, 100, 1), dtype=np.uint8)
+_PLACEHOLDER_IMAGE.flags.writeable = False
+
+# Canvas item ids of one row of the unified window's method selector
+_MethodButton = collections.namedtuple('_MethodButton', ['checkbox', 'text'])
+
+# Highlight for the selected method; bright green works on dark and light themes
+SELECTED_METHOD_COLOR = "#00bb00"
+
+# Pack options of the method control frames in the legacy window
+LEGACY_FRAME_PACK = types.MappingProxyType({"padx": 10, "pady": 5, "fill": "x"})
+
+# Supported color spaces, in the order they are offered in the UI
+COLOR_SPACES = ("BGR", "HSV", "HLS", "Lab", "Luv", "YCrCb", "XYZ", "Grayscale")
+
+# Thresholding methods offered for grayscale and for color spaces, in UI order
+GRAYSCALE_METHODS = ("Simple", "Adaptive", "Otsu", "Triangle")
+COLOR_METHODS = ("Range", "Simple", "Otsu", "Triangle", "Adaptive")
+
+# Threshold types by trackbar/dropdown index; Adaptive supports only the first two
+THRESHOLD_TYPES = ("BINARY", "BINARY_INV", "TRUNC", "TOZERO", "TOZERO_INV")
+ADAPTIVE_THRESHOLD_TYPES = THRESHOLD_TYPES[:2]
+
+# Adaptive threshold methods by trackbar/dropdown index
+ADAPTIVE_METHODS = ("MEAN_C", "GAUSSIAN_C")
+
+# Short description shown next to the color space selector (read-only, shared)
+COLOR_SPACE_DESCRIPTIONS = types.MappingProxyType({
+    "BGR": "BGR - Standard OpenCV color format",
+    "HSV": "HSV - Best for color-based detection",
+    "HLS": "HLS - Alternative color representation",
+    "Lab": "Lab - Perceptually uniform color space",
+    "Luv": "Luv - Another perceptually uniform space",
+    "YCrCb": "YCrCb - Luma-chroma (JPEG standard)",
+    "XYZ": "XYZ - Device-independent color space",
+    "Grayscale": "Grayscale - Single intensity channel"
+})
+
+# Settings a threshold update is computed with, see ThresholdingWindow._threshold_settings()
+_ThresholdSettings = collections.namedtuple('_ThresholdSettings', ['color_space', 'method', 'channels'])
+
+class _NullAnalysisWindow:
+    """
+    Inert stand-in for the analysis control window of the threshold viewer.
+    
+    The minimal threshold viewer never opens an analysis window; ImageViewer
+    code that reaches for one gets these no-op methods instead.
+    """
+    __slots__ = ()
+    window_created = False
+    
+    def create_window(self) -> None:
+        pass
+    
+    def cleanup_windows(self) -> None:
+        pass
+    
+    def update_selections(self) -> None:
+        pass
+    
+    def _process_tk_events(self) -> None:
+        pass
+
+class _ThresholdCache:
+    """
+    Conversions, proxies and output buffers owned by a single thread.
+    
+    The Tk thread and the worker thread of a ThresholdingWindow each use their
+    own instance, so neither waits for the other while a large image is
+    thresholded. An output array handed to the other thread is taken out with
+    release() first and only reused after the Tk thread gives it back.
+    
+    Attributes:
+        cvt_source: The source image cvt_cache was computed from.
+        cvt_cache (dict): Conversions of cvt_source keyed by color space.
+        proxy_source: The source image proxy_image was downscaled from.
+        proxy_image (numpy.ndarray or None): Source downscaled to PREVIEW_MAX_DIM.
+        proxy_cvt_cache (dict): Conversions of proxy_image keyed by color space.
+        buffers (dict): Output arrays reused across updates, keyed by
+                        (name, input shape), see ThresholdingWindow._into().
+        umat_source (tuple or None): (source image, color space) umat was
+                                     converted from and uploaded for.
+        umat (cv2.UMat or None): OpenCL copy of that conversion.
+        auto_thresholds (dict): Otsu/Triangle thresholds keyed by (id(source
+                                image), color space, method).
+        epoch (int): ThresholdingWindow._cache_epoch the contents belong to.
+    """
+    __slots__ = ('cvt_source', 'cvt_cache', 'proxy_source', 'proxy_image', 'proxy_cvt_cache',
+                 'buffers', 'umat_source', 'umat', 'auto_thresholds', 'epoch')
+    
+    def __init__(self) -> None:
+        self.buffers = {}
+        self.epoch = 0
+        self.clear()
+    
+    def clear(self) -> None:
+        """
+        Forget everything derived from earlier source images; buffers are kept.
+        """
+        self.cvt_source = None
+        self.cvt_cache = {}
+        self.proxy_source = None
+        self.proxy_image = None
+        self.proxy_cvt_cache = {}
+        self.umat_source = None
+        self.umat = None
+        self.auto_thresholds = {}
+    
+    def release(self, array):
+        """
+        Stop using array as an output buffer before it is handed to another thread.
+        
+        Args:
+            array: The result about to be handed over.
+        
+        Returns:
+            tuple or None: The buffer key array was stored under, or None if
+                          it is not one of this cache's buffers.
+        """
+        for key, buffer in self.buffers.items():
+            if buffer is array:
+                del self.buffers[key]
+                return key
+        return None
+
 class ThresholdingWindow:
     """
     Comprehensive image thresholding interface with multi-color space support.
@@ -89,11 +233,50 @@ class ThresholdingWindow:
         threshold_method_var: tkinter variable for threshold method selection.
         threshold_type_var: tkinter variable for binary threshold type.
         adaptive_method_var: tkinter variable for adaptive method selection.
+        _method, _threshold_type, _adaptive_method (str or None): Current values
+            of the three variables above, kept in sync by write traces so
+            per-update code does not call StringVar.get().
         color_space_var: tkinter variable for color space selection.
+        threshold_type_combo, adaptive_method_combo: Dropdowns of the active
+            method controls (None until built).
+        adaptive_frame, advanced_controls_frame: Frames holding the adaptive
+            method dropdown for grayscale and color spaces (None until built).
+        method_buttons (dict): Method selector rows of the unified window by method.
         method_trackbars (dict): Trackbar configurations for each method.
         current_method (str): Currently active thresholding method.
         threshold_viewer: Dedicated ImageViewer instance for threshold preview.
         ranges (dict): Valid parameter ranges for each color space.
+        _tk_cache (_ThresholdCache): Conversions, proxy and output buffers used
+                                     by updates computed on the Tk thread.
+        _cache_epoch (int): Bumped when cached source data must be dropped; the
+                            worker thread clears its own cache when it changes.
+        _pending_update (str or None): Tk after() id of a scheduled trackbar update.
+        _pending_method_change (str or None): Tk after() id of a method switch
+                                              requested in the unified window.
+        _last_selected_method (str or None): Method highlighted on method_canvas.
+        _method_fg (str): Theme foreground of unselected rows on method_canvas.
+        _method_controls (dict): Grayscale and color method controls of the
+                                 legacy window, keyed by "Grayscale" and "Color".
+        _status_frame: Frame of the legacy window the method controls pack before.
+        _type_values (tuple or None): Threshold types threshold_type_combo offers.
+        _pending_full (str or None): Tk after() id of the full-resolution update
+                                     that follows a trackbar drag.
+        _last_update (tuple or None): (settings key, source image, preview) of
+                                      the last preview shown, see update_threshold().
+        _job_queue (queue.Queue): Trackbar updates waiting for the worker thread.
+        _result_queue (queue.Queue): Results of the worker thread for the Tk thread.
+        _worker (threading.Thread or None): Background thresholding thread.
+        _job_generation (int): Number of the newest queued update.
+        _received_generation (int): Number of the newest update received back.
+        _submitted (tuple or None): (settings key, source image, preview) of the
+                                    newest queued update.
+        _drain_id (str or None): Tk after() id of the result poller.
+        _spare_buffers (queue.Queue): (buffer key, array) worker outputs the Tk
+                                      thread no longer displays, for reuse.
+        _shown_buffer (tuple or None): (buffer key, array) of the worker output
+                                       currently displayed.
+        _lut (tuple or None): ((threshold, max value, type), 256-entry table)
+                              for Simple grayscale thresholding, see _threshold_lut().
         close_callback: Optional callback function for window closing.
     
     Examples:
@@ -107,6 +290,9 @@ class ThresholdingWindow:
         >>> threshold_window.update_threshold()
         # Updates threshold processing with current parameters
     """
+    # ImageAnalyzer given to every threshold viewer; they never open analysis plots
+    _shared_analyzer = None
+    
     def __init__(self, viewer, color_space: str = None) -> None:
         """
         Initialize the thresholding window with viewer and color space.
@@ -149,6 +335,15 @@ class ThresholdingWindow:
         self.threshold_type_var = None
         self.adaptive_method_var = None
         self.color_space_var = None  # For colorspace selection
+        self.threshold_type_combo = None
+        self.adaptive_method_combo = None
+        self.adaptive_frame = None
+        self.advanced_controls_frame = None
+        self.method_buttons = {}
+        # Plain copies of the variables above, see _choice_var()
+        self._method = None
+        self._threshold_type = None
+        self._adaptive_method = None
         
         # Track which trackbars are created for each method
         self.method_trackbars = {
@@ -166,6 +361,34 @@ class ThresholdingWindow:
         # Create dedicated ImageViewer for thresholding with full functionality
         self.threshold_viewer = None
         self.is_processing = False  # Prevent recursive updates
+        
+        # Conversions and buffers of the Tk thread; the worker keeps its own
+        self._tk_cache = _ThresholdCache()
+        self._cache_epoch = 0
+        # Trackbar-driven update waiting to run, see _on_param_change()
+        self._pending_update = None
+        self._pending_full = None
+        self._pending_method_change = None
+        self._last_selected_method = None
+        # Both sets of legacy method controls, see _show_method_controls()
+        self._method_controls = {}
+        self._status_frame = None
+        self._type_values = None
+        # Settings and source of the preview currently shown
+        self._last_update = None
+        # Trackbar-driven updates computed off the Tk thread, see _submit_update()
+        self._job_queue = queue.Queue()
+        self._result_queue = queue.Queue()
+        self._worker = None
+        self._job_generation = 0
+        self._received_generation = 0
+        self._submitted = None
+        self._drain_id = None
+        # Worker output buffers passed back once no longer displayed
+        self._spare_buffers = queue.Queue()
+        self._shown_buffer = None
+        # Lookup table for Simple grayscale thresholding, see _threshold_lut()
+        self._lut = None
 
         self.ranges = {
             "BGR": {"B": (0, 255), "G": (0, 255), "R": (0, 255)},
@@ -210,7 +433,7 @@ class ThresholdingWindow:
 
         self.trackbar_manager = self.threshold_viewer.trackbar
         
-        self.root = tk.Toplevel()
+        self.root = tk.Toplevel(self._tk_master())
         self.root.title("Thresholding Controls")
         self.root.geometry("500x700")
         
@@ -224,15 +447,17 @@ class ThresholdingWindow:
         separator = ttk.Separator(self.root, orient='horizontal')
         separator.pack(fill='x', padx=10, pady=5)
 
-        # Create method controls based on colorspace
-        if self.color_space == "Grayscale":
-            self._create_grayscale_method_controls()
-        else:
-            self._create_color_method_controls()
+        # Create both sets of method controls once; color space changes
+        # only swap which set is packed
+        self._method_controls = {
+            "Grayscale": self._create_grayscale_method_controls(),
+            "Color": self._create_color_method_controls(),
+        }
         
         # Create status and buttons sections
         self._create_status_section()
         self._create_buttons_section()
+        self._show_method_controls()
 
         self.window_created = True
         self.root.protocol("WM_DELETE_WINDOW", self.destroy_window)
@@ -270,7 +495,7 @@ class ThresholdingWindow:
             return
 
         # Create tkinter window
-        self.root = tk.Toplevel()
+        self.root = tk.Toplevel(self._tk_master())
         self.root.title("Thresholding Controls")
         # Start with reasonable initial size, will be adjusted later
         self.root.geometry("480x300")
@@ -314,6 +539,41 @@ class ThresholdingWindow:
         self.window_created = True
         self.root.protocol("WM_DELETE_WINDOW", self.destroy_window)
     
+    def _choice_var(self, attr: str, value: str) -> tk.StringVar:
+        """
+        Create a StringVar whose value is mirrored in the plain attribute attr.
+        
+        A write trace copies every change, whether from a widget or from set(),
+        so code running on each update reads the attribute instead of making
+        a Tcl round-trip through get().
+        
+        Args:
+            attr (str): Name of the attribute to keep in sync, e.g. "_method".
+            value (str): Initial value.
+        
+        Returns:
+            tk.StringVar: The new variable.
+        """
+        var = tk.StringVar(value=value)
+        setattr(self, attr, value)
+        var.trace_add("write", lambda *_: setattr(self, attr, var.get()))
+        return var
+
+    def _tk_master(self):
+        """
+        Return the Tk window to parent the thresholding Toplevel to.
+        
+        Uses the main viewer's analysis control window so the thresholding
+        window shares the application's existing Tk interpreter, instead of
+        relying on (or implicitly creating) a default root.
+        
+        Returns:
+            The analysis control window's root, or None to fall back to
+            tkinter's default root.
+        """
+        analysis_window = getattr(self.viewer, 'analysis_window', None)
+        return getattr(analysis_window, 'root', None)
+
     def _adjust_window_size(self) -> None:
         """
         Dynamically adjust window size to fit current content.
@@ -368,7 +628,8 @@ class ThresholdingWindow:
             self.root.geometry(f"{final_width}x{final_height}")
             
         except Exception as e:
-            print(f"Error adjusting window size: {e}")
+            # Typically the window closed before the delayed resize ran
+            logger.debug("Error adjusting window size: %s", e)
 
     
     def _create_colorspace_selection_unified(self) -> None:
@@ -400,7 +661,7 @@ class ThresholdingWindow:
         colorspace_frame.pack(fill='x', padx=5, pady=5)
         
         # Available color spaces
-        color_spaces = ["BGR", "HSV", "HLS", "Lab", "Luv", "YCrCb", "XYZ", "Grayscale"]
+        color_spaces = COLOR_SPACES
         
         # Colorspace selection (removed info text)
         selection_frame = ttk.Frame(colorspace_frame, style=self.theme_manager.get_frame_style())
@@ -414,6 +675,7 @@ class ThresholdingWindow:
                                        values=color_spaces, state="readonly", width=15,
                                        style=self.theme_manager.get_combobox_style())
         color_space_combo.pack(side=tk.LEFT, padx=(0, 10))
+        # The change handler also updates the description label
         color_space_combo.bind('<<ComboboxSelected>>', self._on_colorspace_change_unified)
         
         # Description label that updates with selection
@@ -423,36 +685,17 @@ class ThresholdingWindow:
         desc_label.pack(side=tk.LEFT, padx=(10, 0))
         
         # Enhanced color space descriptions
-        self.color_space_descriptions = {
-            "BGR": "BGR - Standard OpenCV color format",
-            "HSV": "HSV - Best for color-based detection",
-            "HLS": "HLS - Alternative color representation", 
-            "Lab": "Lab - Perceptually uniform color space",
-            "Luv": "Luv - Another perceptually uniform space",
-            "YCrCb": "YCrCb - Luma-chroma (JPEG standard)",
-            "XYZ": "XYZ - Device-independent color space",
-            "Grayscale": "Grayscale - Single intensity channel"
-        }
+        self.color_space_descriptions = COLOR_SPACE_DESCRIPTIONS
         
         # Don't set initial selection - user must choose
         self.color_space_var.set("")
         self.desc_var.set("Please select a color space above")
         
-        # Bind description update
-        def update_description(event=None):
-            selected = self.color_space_var.get()
-            if selected:
-                self.desc_var.set(self.color_space_descriptions.get(selected, ""))
-            else:
-                self.desc_var.set("Please select a color space above")
-        
-        color_space_combo.bind('<<ComboboxSelected>>', lambda e: [update_description(e), self._on_colorspace_change_unified(e)])
-        
         # Determine if grayscale image
         if self.viewer._internal_images:
             current_idx = self.viewer.trackbar.parameters.get('show', 0)
             image, _ = self.viewer._internal_images[current_idx]
-            is_grayscale = len(image.shape) == 2
+            is_grayscale = image.ndim == 2
             
             if is_grayscale:
                 note_text = "Note: Grayscale image detected - color spaces will show converted results"
@@ -504,8 +747,8 @@ class ThresholdingWindow:
         # Ensure the initial method selection is visually highlighted
         self._update_method_selection_style()
         
-        # Adjust window size to fit content (with small delay)
-        self.root.after(100, self._adjust_window_size)
+        # Adjust window size to fit content once Tk is idle
+        self.root.after_idle(self._adjust_window_size)
         
     def _create_or_update_threshold_viewer(self) -> None:
         """
@@ -581,45 +824,41 @@ class ThresholdingWindow:
         
         if self.color_space == "Grayscale":
             # Grayscale methods
-            self.threshold_method_var = tk.StringVar(value="Simple")
-            methods = ["Simple", "Adaptive", "Otsu", "Triangle"]
+            self.threshold_method_var = self._choice_var("_method", "Simple")
+            methods = GRAYSCALE_METHODS
         else:
             # Color space methods
-            self.threshold_method_var = tk.StringVar(value="Range")
-            methods = ["Range", "Simple", "Otsu", "Triangle", "Adaptive"]
+            self.threshold_method_var = self._choice_var("_method", "Range")
+            methods = COLOR_METHODS
+        
+        # Draw all method rows (square checkbox + name) on one canvas
+        row_height = 24
+        self._method_fg = self.theme_manager.theme.get('fg', '#ffffff')
+        self._last_selected_method = None
+        self.method_canvas = tk.Canvas(method_frame, height=len(methods) * row_height,
+                                       background=self.theme_manager.theme.get('frame_bg', '#343a40'),
+                                       highlightthickness=0, borderwidth=0, cursor="hand2")
+        self.method_canvas.pack(fill='x', padx=5, pady=2)
+        
+        for row, method in enumerate(methods):
+            y = row * row_height + row_height // 2
+            # Store canvas item ids for styling updates
+            self.method_buttons[method] = _MethodButton(
+                checkbox=self.method_canvas.create_text(10, y, text="☐", anchor='w',
+                                                        fill=self._method_fg,
+                                                        font=("Arial", 12)),
+                text=self.method_canvas.create_text(34, y, text=method, anchor='w',
+                                                    fill=self._method_fg,
+                                                    font=("Arial", 10))
+            )
         
-        # Create custom square method buttons
-        for method in methods:
-            method_container = ttk.Frame(method_frame, style=self.theme_manager.get_frame_style())
-            method_container.pack(fill='x', padx=5, pady=2)
-            
-            # Create square checkbox using Unicode character
-            checkbox_label = ttk.Label(method_container, text="☐", font=("Arial", 12))
-            checkbox_label.pack(side=tk.LEFT, padx=(5, 8))
-            
-            # Create method text label
-            method_label = ttk.Label(method_container, text=method, font=("Arial", 10))
-            method_label.pack(side=tk.LEFT)
-            
-            # Store references for styling updates
-            self.method_buttons[method] = {
-                'checkbox': checkbox_label,
-                'text': method_label,
-                'container': method_container
-            }
-            
-            # Bind click events to both checkbox and text
-            def make_click_handler(method_name):
-                def on_click(event):
-                    self.threshold_method_var.set(method_name)
-                    self._update_method_selection_style()
-                    self._on_method_change_unified()
-                return on_click
-            
-            click_handler = make_click_handler(method)
-            checkbox_label.bind("<Button-1>", click_handler)
-            method_label.bind("<Button-1>", click_handler)
-            method_container.bind("<Button-1>", click_handler)
+        # One binding for all rows; the clicked row selects the method
+        def on_click(event):
+            row = min(max(event.y // row_height, 0), len(methods) - 1)
+            self.threshold_method_var.set(methods[row])
+            self._update_method_selection_style()
+            self._on_method_change_unified()
+        self.method_canvas.bind("<Button-1>", on_click)
         
         # Set initial selection style
         self._update_method_selection_style()
@@ -629,24 +868,17 @@ class ThresholdingWindow:
                                   style=self.theme_manager.get_frame_style())
         type_frame.pack(fill='x', pady=5)
         
-        self.threshold_type_var = tk.StringVar(value="BINARY")
-        types = ["BINARY", "BINARY_INV", "TRUNC", "TOZERO", "TOZERO_INV"]
+        self.threshold_type_var = self._choice_var("_threshold_type", "BINARY")
         self.threshold_type_combo = ttk.Combobox(type_frame, textvariable=self.threshold_type_var, 
-                                                values=types, state="readonly", width=15,
+                                                values=THRESHOLD_TYPES, state="readonly", width=15,
                                                 style=self.theme_manager.get_combobox_style())
         self.threshold_type_combo.pack(padx=5, pady=5)
         self.threshold_type_combo.bind("<<ComboboxSelected>>", self._on_threshold_type_change_unified)
+        self._type_values = THRESHOLD_TYPES
         
-        # Adaptive method frame (initially hidden)
-        self.adaptive_frame = ttk.LabelFrame(self.controls_frame, text="Adaptive Method", 
-                                           style=self.theme_manager.get_frame_style())
-        self.adaptive_method_var = tk.StringVar(value="MEAN_C")
-        adaptive_methods = ["MEAN_C", "GAUSSIAN_C"]
-        self.adaptive_method_combo = ttk.Combobox(self.adaptive_frame, textvariable=self.adaptive_method_var,
-                                                 values=adaptive_methods, state="readonly", width=15,
-                                                 style=self.theme_manager.get_combobox_style())
-        self.adaptive_method_combo.pack(padx=5, pady=5)
-        self.adaptive_method_combo.bind("<<ComboboxSelected>>", self._on_adaptive_method_change_unified)
+        # Adaptive method frame, built on first selection of Adaptive
+        self.adaptive_frame = None
+        self.adaptive_method_var = self._choice_var("_adaptive_method", "MEAN_C")
         
         # Status display
         status_frame = ttk.LabelFrame(self.controls_frame, text="Current Parameters", 
@@ -680,7 +912,10 @@ class ThresholdingWindow:
         
         Applies appropriate styling to method selection buttons to indicate
         the currently selected method using theme-aware active and inactive
-        button styles.
+        button styles. The buttons are items on method_canvas, so each
+        update is a set of itemconfigure calls on a single widget. Only the
+        previously and newly selected rows are restyled; nothing is sent to
+        Tk when the selection has not changed.
         
         Args:
             None: This method takes no arguments.
@@ -695,30 +930,30 @@ class ThresholdingWindow:
             >>> # Adaptive method button highlighted, others reset to normal
             
         Performance:
-            Time Complexity: O(n) where n is number of method buttons.
+            Time Complexity: O(1) - At most two rows are restyled.
             Space Complexity: O(1) - No additional memory allocation.
         """
-        if not hasattr(self, 'method_buttons'):
+        if not self.method_buttons:
             return
             
-        selected_method = self.threshold_method_var.get()
+        selected_method = self._method
+        if selected_method == self._last_selected_method:
+            return
+        canvas = self.method_canvas
         
-        # Get theme colors
-        default_fg = self.theme_manager.theme.get('fg', '#ffffff')
-        green_color = "#00bb00"  # Bright green that works on both dark and light backgrounds
+        previous = self.method_buttons.get(self._last_selected_method)
+        if previous is not None:
+            # Unselected: empty square checkbox and default text color
+            canvas.itemconfigure(previous.checkbox, text="☐", fill=self._method_fg)
+            canvas.itemconfigure(previous.text, fill=self._method_fg)
         
-        for method, components in self.method_buttons.items():
-            checkbox = components['checkbox']
-            text_label = components['text']
-            
-            if method == selected_method:
-                # Selected: filled square checkbox and green text
-                checkbox.config(text="☑", foreground=green_color)  # Green checkbox
-                text_label.config(foreground=green_color)  # Green text
-            else:
-                # Unselected: empty square checkbox and default text color
-                checkbox.config(text="☐", foreground=default_fg)
-                text_label.config(foreground=default_fg)
+        current = self.method_buttons.get(selected_method)
+        if current is not None:
+            # Selected: filled square checkbox and green text
+            canvas.itemconfigure(current.checkbox, text="☑", fill=SELECTED_METHOD_COLOR)
+            canvas.itemconfigure(current.text, fill=SELECTED_METHOD_COLOR)
+        
+        self._last_selected_method = selected_method
     
     def _on_method_change_unified(self) -> None:
         """
@@ -726,7 +961,9 @@ class ThresholdingWindow:
         
         Updates the unified interface when the user selects a different
         thresholding method, including updating UI elements and switching
-        trackbar configurations.
+        trackbar configurations. The selection highlight updates at once;
+        the trackbar rebuild and threshold update run 30 ms after the last
+        of a series of quick clicks, for the method selected then.
         
         Args:
             None: This method takes no arguments.
@@ -747,14 +984,33 @@ class ThresholdingWindow:
         if not self.threshold_method_var:
             return
         
-        method = self.threshold_method_var.get()
         self._update_method_selection_style()  # Update visual selection
+        
+        # Coalesce quick successive clicks into one method switch
+        if self._pending_method_change is not None:
+            self.root.after_cancel(self._pending_method_change)
+        self._pending_method_change = self.root.after(30, self._apply_pending_method_change)
+    
+    def _apply_pending_method_change(self) -> None:
+        """
+        Switch trackbars and controls to the selected method, scheduled by
+        _on_method_change_unified(). Does nothing if the clicks ended on the
+        method already in use. Only the adaptive controls change the window's
+        content size, so the window is resized only when switching to or
+        from Adaptive.
+        """
+        self._pending_method_change = None
+        method = self._method
+        if method == self.current_method:
+            return
+        resize = (method == "Adaptive") != (self.current_method == "Adaptive")
         self._switch_to_method(method)
         self._update_ui_for_method_unified(method)
         self.update_threshold()
         
-        # Adjust window size for method-specific controls (with small delay)
-        self.root.after(50, self._adjust_window_size)
+        # Adjust window size for method-specific controls once Tk is idle
+        if resize:
+            self.root.after_idle(self._adjust_window_size)
     
     def _on_threshold_type_change_unified(self, event=None) -> None:
         """
@@ -807,12 +1063,29 @@ class ThresholdingWindow:
         """
         self._on_dropdown_adaptive_method_change(event)
     
+    def _build_adaptive_controls_unified(self) -> None:
+        """
+        Create the adaptive method frame and dropdown of the unified window.
+        
+        Called the first time the Adaptive method is selected; the frame is
+        then shown and hidden with pack()/pack_forget() on later switches.
+        """
+        self.adaptive_frame = ttk.LabelFrame(self.controls_frame, text="Adaptive Method", 
+                                           style=self.theme_manager.get_frame_style())
+        adaptive_methods = ADAPTIVE_METHODS
+        self.adaptive_method_combo = ttk.Combobox(self.adaptive_frame, textvariable=self.adaptive_method_var,
+                                                 values=adaptive_methods, state="readonly", width=15,
+                                                 style=self.theme_manager.get_combobox_style())
+        self.adaptive_method_combo.pack(padx=5, pady=5)
+        self.adaptive_method_combo.bind("<<ComboboxSelected>>", self._on_adaptive_method_change_unified)
+
     def _update_ui_for_method_unified(self, method: str) -> None:
         """
         Update UI elements for the selected method in the unified window.
         
         Adjusts the user interface to show or hide controls appropriate
         for the selected thresholding method in the unified window interface.
+        The adaptive controls are created on the first switch to Adaptive.
         
         Args:
             method (str): The selected thresholding method name. Must be one of:
@@ -832,19 +1105,31 @@ class ThresholdingWindow:
             Time Complexity: O(1) - Fixed UI element show/hide operations.
             Space Complexity: O(1) - No additional memory allocation.
         """
-        if not hasattr(self, 'adaptive_frame'):
+        if self.threshold_type_combo is None:
             return
             
         if method == "Adaptive":
+            if self.adaptive_frame is None:
+                self._build_adaptive_controls_unified()
             self.adaptive_frame.pack(fill='x', pady=5, after=self.threshold_type_combo.master)
             # Limit threshold types for adaptive
-            if hasattr(self, 'threshold_type_combo'):
-                self.threshold_type_combo['values'] = ["BINARY", "BINARY_INV"]
+            self._set_threshold_type_values(ADAPTIVE_THRESHOLD_TYPES)
         else:
-            self.adaptive_frame.pack_forget()
+            if self.adaptive_frame is not None:
+                self.adaptive_frame.pack_forget()
             # All types available for other methods
-            if hasattr(self, 'threshold_type_combo'):
-                self.threshold_type_combo['values'] = ["BINARY", "BINARY_INV", "TRUNC", "TOZERO", "TOZERO_INV"]
+            self._set_threshold_type_values(THRESHOLD_TYPES)
+    
+    def _set_threshold_type_values(self, values: tuple) -> None:
+        """
+        Offer values in threshold_type_combo unless it already offers them.
+        
+        Args:
+            values (tuple): THRESHOLD_TYPES or ADAPTIVE_THRESHOLD_TYPES.
+        """
+        if self._type_values is not values:
+            self.threshold_type_combo['values'] = values
+            self._type_values = values
 
     def create_simple_threshold_viewer(self) -> None:
         """
@@ -913,7 +1198,7 @@ class ThresholdingWindow:
         colorspace_frame.pack(padx=10, pady=5, fill="x")
         
         # Available color spaces
-        color_spaces = ["BGR", "HSV", "HLS", "Lab", "Luv", "YCrCb", "XYZ", "Grayscale"]
+        color_spaces = COLOR_SPACES
         
         # Info label
         info_text = "Available methods: Range, Simple, Otsu, Triangle, Adaptive\nAll color spaces supported with automatic conversion"
@@ -940,16 +1225,7 @@ class ThresholdingWindow:
         desc_label.pack(side=tk.LEFT, padx=(10, 0))
         
         # Enhanced color space descriptions
-        self.color_space_descriptions = {
-            "BGR": "BGR - Standard OpenCV color format",
-            "HSV": "HSV - Best for color-based detection",
-            "HLS": "HLS - Alternative color representation", 
-            "Lab": "Lab - Perceptually uniform color space",
-            "Luv": "Luv - Another perceptually uniform space",
-            "YCrCb": "YCrCb - Luma-chroma (JPEG standard)",
-            "XYZ": "XYZ - Device-independent color space",
-            "Grayscale": "Grayscale - Single intensity channel"
-        }
+        self.color_space_descriptions = COLOR_SPACE_DESCRIPTIONS
         
         # Set initial description
         self.desc_var.set(self.color_space_descriptions.get(self.color_space, ""))
@@ -958,7 +1234,7 @@ class ThresholdingWindow:
         if self.viewer._internal_images:
             current_idx = self.viewer.trackbar.parameters.get('show', 0)
             image, _ = self.viewer._internal_images[current_idx]
-            is_grayscale = len(image.shape) == 2
+            is_grayscale = image.ndim == 2
             
             if is_grayscale:
                 note_text = "Note: Grayscale image detected - color spaces will show converted results"
@@ -1047,56 +1323,67 @@ class ThresholdingWindow:
     
     def _recreate_method_controls(self) -> None:
         """
-        Recreate method control sections for the newly selected color space.
+        Switch method control sections to the newly selected color space.
         
-        Rebuilds the method selection controls to match the capabilities of the
+        Shows the method selection controls matching the capabilities of the
         current color space. Grayscale images get grayscale-specific controls,
-        while color images get color-appropriate method options.
+        while color images get color-appropriate method options. Both sets are
+        built by create_window(), so no widgets are destroyed or created here.
         
         Args:
             None: This method takes no arguments.
         
         Returns:
-            None: Recreates method controls as side effect, no return value.
+            None: Switches method controls as side effect, no return value.
         
         Examples:
             >>> threshold_window = ThresholdingWindow(viewer, "BGR")
             >>> threshold_window.color_space = "Grayscale"
             >>> threshold_window._recreate_method_controls()
-            >>> # Color controls removed, grayscale controls created
+            >>> # Color controls hidden, grayscale controls shown
             
         Performance:
-            Time Complexity: O(n) where n is number of UI widgets to destroy/create.
-            Space Complexity: O(1) - Fixed memory for new control widgets.
+            Time Complexity: O(1) - Fixed number of frames packed and forgotten.
+            Space Complexity: O(1) - No widgets are allocated.
         """
-        # Remove existing method controls (find all LabelFrames except colorspace)
-        for widget in self.root.winfo_children():
-            if isinstance(widget, ttk.LabelFrame) and widget.cget('text') not in ['Color Space Selection']:
-                widget.destroy()
-        
-        # Also remove any separators after the colorspace section
-        for widget in self.root.winfo_children():
-            if isinstance(widget, ttk.Separator):
-                widget.destroy()
-        
-        # Recreate separator
-        separator = ttk.Separator(self.root, orient='horizontal')
-        separator.pack(fill='x', padx=10, pady=5)
-        
-        # Recreate method controls based on new colorspace
-        if self.color_space == "Grayscale":
-            self._create_grayscale_method_controls()
-        else:
-            self._create_color_method_controls()
-        
-        # Recreate other sections
-        self._create_status_section()
-        self._create_buttons_section()
+        self._show_method_controls()
         
         # Update current method
         self.current_method = "Simple" if self.color_space == "Grayscale" else "Range"
+    
+    def _show_method_controls(self) -> None:
+        """
+        Pack the method controls of the current color space and hide the others.
         
-    def _create_grayscale_method_controls(self) -> None:
+        Points threshold_method_var, threshold_type_var, adaptive_method_var and
+        their widgets at the shown set and resets them to their defaults, as a
+        freshly built set of controls would be.
+        """
+        kind = "Grayscale" if self.color_space == "Grayscale" else "Color"
+        for name, controls in self._method_controls.items():
+            if name != kind:
+                for frame in controls['frames'] + controls['optional_frames']:
+                    frame.pack_forget()
+        
+        controls = self._method_controls[kind]
+        for frame in controls['optional_frames']:
+            frame.pack_forget()
+        for frame in controls['frames']:
+            frame.pack(before=self._status_frame, **LEGACY_FRAME_PACK)
+        
+        self.threshold_method_var = controls['threshold_method_var']
+        self.threshold_type_var = controls['threshold_type_var']
+        self.adaptive_method_var = controls['adaptive_method_var']
+        self.threshold_type_combo = controls['threshold_type_combo']
+        self.adaptive_method_combo = controls['adaptive_method_combo']
+        
+        self.threshold_method_var.set("Simple" if kind == "Grayscale" else "Range")
+        self.threshold_type_var.set("BINARY")
+        self.adaptive_method_var.set("MEAN_C")
+        self.threshold_type_combo['values'] = THRESHOLD_TYPES
+        self._type_values = THRESHOLD_TYPES
+        
+    def _create_grayscale_method_controls(self) -> dict:
         """
         Create thresholding method controls specific to grayscale images.
         
@@ -1108,11 +1395,12 @@ class ThresholdingWindow:
             None: This method takes no arguments.
         
         Returns:
-            None: Creates grayscale controls as side effect, no return value.
+            dict: The controls' frames, variables and widgets, as used by
+                  _show_method_controls().
         
         Examples:
             >>> threshold_window = ThresholdingWindow(viewer, "Grayscale")
-            >>> threshold_window._create_grayscale_method_controls()
+            >>> controls = threshold_window._create_grayscale_method_controls()
             >>> # Creates: Simple, Adaptive, Otsu, Triangle method controls
             >>> # Plus threshold type and adaptive method dropdowns
             
@@ -1130,8 +1418,8 @@ class ThresholdingWindow:
         method_frame = ttk.LabelFrame(self.root, text="Thresholding Method", style=self.theme_manager.get_frame_style())
         method_frame.pack(padx=10, pady=5, fill="x")
         
-        self.threshold_method_var = tk.StringVar(value="Simple")
-        methods = ["Simple", "Adaptive", "Otsu", "Triangle"]
+        self.threshold_method_var = self._choice_var("_method", "Simple")
+        methods = GRAYSCALE_METHODS
         for method in methods:
             ttk.Radiobutton(method_frame, text=method, variable=self.threshold_method_var, 
                            value=method, command=self.on_method_change).pack(anchor="w")
@@ -1140,25 +1428,26 @@ class ThresholdingWindow:
         type_frame = ttk.LabelFrame(self.root, text="Threshold Type", style=self.theme_manager.get_frame_style())
         type_frame.pack(padx=10, pady=5, fill="x")
         
-        self.threshold_type_var = tk.StringVar(value="BINARY")
-        types = ["BINARY", "BINARY_INV", "TRUNC", "TOZERO", "TOZERO_INV"]
+        self.threshold_type_var = self._choice_var("_threshold_type", "BINARY")
         self.threshold_type_combo = ttk.Combobox(type_frame, textvariable=self.threshold_type_var, 
-                                                values=types, state="readonly", width=15,
+                                                values=THRESHOLD_TYPES, state="readonly", width=15,
                                                 style=self.theme_manager.get_combobox_style())
         self.threshold_type_combo.pack(padx=5, pady=5)
         self.threshold_type_combo.bind("<<ComboboxSelected>>", self._on_dropdown_threshold_type_change)
         
         # Adaptive method selection (initially hidden)
         self.adaptive_frame = ttk.LabelFrame(self.root, text="Adaptive Method", style=self.theme_manager.get_frame_style())
-        self.adaptive_method_var = tk.StringVar(value="MEAN_C")
-        adaptive_methods = ["MEAN_C", "GAUSSIAN_C"]
+        self.adaptive_method_var = self._choice_var("_adaptive_method", "MEAN_C")
+        adaptive_methods = ADAPTIVE_METHODS
         self.adaptive_method_combo = ttk.Combobox(self.adaptive_frame, textvariable=self.adaptive_method_var,
                                                  values=adaptive_methods, state="readonly", width=15,
                                                  style=self.theme_manager.get_combobox_style())
         self.adaptive_method_combo.pack(padx=5, pady=5)
         self.adaptive_method_combo.bind("<<ComboboxSelected>>", self._on_dropdown_adaptive_method_change)
+        
+        return self._method_control_set((method_frame, type_frame), (self.adaptive_frame,))
     
-    def _create_color_method_controls(self) -> None:
+    def _create_color_method_controls(self) -> dict:
         """
         Create thresholding method controls specific to color images.
         
@@ -1170,13 +1459,14 @@ class ThresholdingWindow:
             None: This method takes no arguments.
         
         Returns:
-            None: Creates color controls as side effect, no return value.
+            dict: The controls' frames, variables and widgets, as used by
+                  _show_method_controls().
         
         Examples:
             >>> threshold_window = ThresholdingWindow(viewer, "HSV")
-            >>> threshold_window._create_color_method_controls()
+            >>> controls = threshold_window._create_color_method_controls()
             >>> # Creates: Range, Simple, Otsu, Triangle, Adaptive method controls
-            >>> # Plus threshold type dropdown and advanced controls
+            >>> # Plus threshold type dropdown; advanced controls follow on first Adaptive
             
         Performance:
             Time Complexity: O(1) - Fixed number of UI control creation.
@@ -1192,8 +1482,8 @@ class ThresholdingWindow:
         method_frame = ttk.LabelFrame(self.root, text="Thresholding Method", style=self.theme_manager.get_frame_style())
         method_frame.pack(padx=10, pady=5, fill="x")
         
-        self.threshold_method_var = tk.StringVar(value="Range")
-        methods = ["Range", "Simple", "Otsu", "Triangle", "Adaptive"]
+        self.threshold_method_var = self._choice_var("_method", "Range")
+        methods = COLOR_METHODS
         for method in methods:
             ttk.Radiobutton(method_frame, text=method, variable=self.threshold_method_var, 
                            value=method, command=self.on_color_method_change).pack(anchor="w")
@@ -1202,26 +1492,65 @@ class ThresholdingWindow:
         type_frame = ttk.LabelFrame(self.root, text="Threshold Type", style=self.theme_manager.get_frame_style())
         type_frame.pack(padx=10, pady=5, fill="x")
         
-        self.threshold_type_var = tk.StringVar(value="BINARY")
-        types = ["BINARY", "BINARY_INV", "TRUNC", "TOZERO", "TOZERO_INV"]
+        self.threshold_type_var = self._choice_var("_threshold_type", "BINARY")
         self.threshold_type_combo = ttk.Combobox(type_frame, textvariable=self.threshold_type_var, 
-                                                values=types, state="readonly", width=15,
+                                                values=THRESHOLD_TYPES, state="readonly", width=15,
                                                 style=self.theme_manager.get_combobox_style())
         self.threshold_type_combo.pack(padx=5, pady=5)
         self.threshold_type_combo.bind("<<ComboboxSelected>>", self._on_dropdown_threshold_type_change)
         
-        # Advanced controls frame (initially hidden)
-        self.advanced_controls_frame = ttk.LabelFrame(self.root, text="Advanced Controls", style=self.theme_manager.get_frame_style())
+        # Adaptive method selection for color spaces; its frame and dropdown
+        # are built by _ensure_color_advanced_controls() when first needed
+        self.adaptive_method_var = self._choice_var("_adaptive_method", "MEAN_C")
+        self.adaptive_method_combo = None
+        
+        return self._method_control_set((method_frame, type_frame), ())
+    
+    def _ensure_color_advanced_controls(self) -> None:
+        """
+        Create the legacy window's Advanced Controls frame for color spaces.
         
-        # Adaptive method selection for color spaces
-        self.adaptive_method_var = tk.StringVar(value="MEAN_C")
-        adaptive_methods = ["MEAN_C", "GAUSSIAN_C"]
+        Called the first time Adaptive is selected for a color space; later
+        calls do nothing. The frame and dropdown are added to the color set
+        in _method_controls so _show_method_controls() hides them too.
+        """
+        if self.advanced_controls_frame is not None:
+            return
+        
+        self.advanced_controls_frame = ttk.LabelFrame(self.root, text="Advanced Controls", style=self.theme_manager.get_frame_style())
+        adaptive_methods = ADAPTIVE_METHODS
         ttk.Label(self.advanced_controls_frame, text="Adaptive Method:", style=self.theme_manager.get_label_style()).grid(row=0, column=0, sticky="w", padx=5, pady=2)
         self.adaptive_method_combo = ttk.Combobox(self.advanced_controls_frame, textvariable=self.adaptive_method_var,
                                                  values=adaptive_methods, state="readonly", width=12,
                                                  style=self.theme_manager.get_combobox_style())
         self.adaptive_method_combo.grid(row=0, column=1, padx=5, pady=2)
         self.adaptive_method_combo.bind("<<ComboboxSelected>>", self._on_dropdown_adaptive_method_change)
+        
+        controls = self._method_controls["Color"]
+        controls['optional_frames'] = (self.advanced_controls_frame,)
+        controls['adaptive_method_combo'] = self.adaptive_method_combo
+    
+    def _method_control_set(self, frames: tuple, optional_frames: tuple) -> dict:
+        """
+        Collect the method controls just built into a dict for _show_method_controls().
+        
+        Args:
+            frames (tuple): Frames that are packed whenever the set is shown.
+            optional_frames (tuple): Frames packed only for some methods.
+        
+        Returns:
+            dict: The frames plus the current method/type/adaptive variables
+                  and dropdowns.
+        """
+        return {
+            'frames': frames,
+            'optional_frames': optional_frames,
+            'threshold_method_var': self.threshold_method_var,
+            'threshold_type_var': self.threshold_type_var,
+            'adaptive_method_var': self.adaptive_method_var,
+            'threshold_type_combo': self.threshold_type_combo,
+            'adaptive_method_combo': self.adaptive_method_combo,
+        }
     
     def _create_status_section(self) -> None:
         """
@@ -1250,6 +1579,7 @@ class ThresholdingWindow:
         # Status display frame
         status_frame = ttk.LabelFrame(self.root, text="Current Parameters", style=self.theme_manager.get_frame_style())
         status_frame.pack(padx=10, pady=5, fill="x")
+        self._status_frame = status_frame
         
         self.status_text = tk.Text(status_frame, height=4, width=40, font=("Consolas", 8))
         self.status_text.pack(padx=5, pady=5, fill="x")
@@ -1364,8 +1694,6 @@ class ThresholdingWindow:
         from ..events.mouse_handler import MouseHandler
         from ..controls.trackbar_manager import TrackbarManager
         from ..analysis import ImageAnalyzer
-        from types import SimpleNamespace
-        import numpy as np
         
         # Create the ImageViewer but bypass its normal initialization
         viewer = object.__new__(ImageViewer)  # Create without calling __init__
@@ -1400,6 +1728,15 @@ class ThresholdingWindow:
         viewer._cached_scaled_image = None
         viewer._cached_size_ratio = None
         viewer._cached_show_area = None
+        # Source rows/columns sampled for the current view, see _create_zoom_pan_method()
+        viewer._viewport_index = None
+        # Display canvas reused between frames while the window size is unchanged
+        viewer._display_canvas = None
+        # time.monotonic() of the last refresh drawn while panning
+        viewer._last_refresh_ts = 0.0
+        # Mouse and frame errors repeat at event rate; print only the first of each
+        viewer._mouse_error_logged = False
+        viewer._frame_error_logged = False
         
         # Add zoom/pan limits similar to main window
         viewer.config.min_size_ratio = 0.1
@@ -1413,15 +1750,12 @@ class ThresholdingWindow:
         viewer.mouse.mouse_point = [0, 0]  # Initialize mouse position
         viewer.trackbar = TrackbarManager(config.trackbar_window_name)
         viewer.windows = self._create_custom_window_manager(config)
-        viewer.analyzer = ImageAnalyzer()
+        if ThresholdingWindow._shared_analyzer is None:
+            ThresholdingWindow._shared_analyzer = ImageAnalyzer()
+        viewer.analyzer = ThresholdingWindow._shared_analyzer
         
         # Create completely inert analysis window mock
-        viewer.analysis_window = SimpleNamespace()
-        viewer.analysis_window.create_window = lambda: None
-        viewer.analysis_window.cleanup_windows = lambda: None 
-        viewer.analysis_window.update_selections = lambda: None
-        viewer.analysis_window._process_tk_events = lambda: None
-        viewer.analysis_window.window_created = False
+        viewer.analysis_window = _NullAnalysisWindow()
         
         # Override ALL methods that could create unwanted windows
         viewer._show_text_window = lambda: None
@@ -1440,54 +1774,27 @@ class ThresholdingWindow:
         # Add zoom/pan transformation methods
         viewer._apply_zoom_pan_transform = self._create_zoom_pan_method(viewer)
         
-        # Add display_images property that triggers processing
-        def get_display_images():
-            return viewer._internal_images
-            
-        def set_display_images(image_list):
-            if not isinstance(image_list, list) or not image_list:
-                viewer._internal_images = [(np.zeros((100, 100, 1), dtype=np.uint8), "Empty")]
-                return
-                
-            # Validate images
-            valid_images = []
-            for item in image_list:
-                if isinstance(item, tuple) and len(item) == 2:
-                    img, title = item
-                    if isinstance(img, np.ndarray) and img.size > 0:
-                        valid_images.append((img, title))
-                        
-            if not valid_images:
-                viewer._internal_images = [(np.zeros((100, 100, 1), dtype=np.uint8), "Invalid Images")]
-            else:
-                viewer._internal_images = valid_images
-            
-            # Process the image if viewer is active
-            if viewer.config.enable_debug and viewer._should_continue_loop and hasattr(viewer, 'windows') and viewer.windows.windows_created:
-                try:
-                    viewer._process_frame_and_check_quit()
-                except Exception as e:
-                    print(f"Error in display update: {e}")
-        
         # Create display_images as simple methods instead of property
         def get_display_images():
             return viewer._internal_images
             
         def set_display_images(image_list):
             if not isinstance(image_list, list) or not image_list:
-                viewer._internal_images = [(np.zeros((100, 100, 1), dtype=np.uint8), "Empty")]
+                viewer._internal_images = [(_PLACEHOLDER_IMAGE, "Empty")]
                 return
                 
-            # Validate images
-            valid_images = []
-            for item in image_list:
-                if isinstance(item, tuple) and len(item) == 2:
-                    img, title = item
-                    if isinstance(img, np.ndarray) and img.size > 0:
-                        valid_images.append((img, title))
+            # Validate images: unpack every entry as (image, title) in one pass,
+            # and only check entry by entry if some entry is not a pair
+            try:
+                valid_images = [(img, title) for img, title in image_list
+                                if isinstance(img, np.ndarray) and img.size > 0]
+            except (TypeError, ValueError):
+                valid_images = [item for item in image_list
+                                if isinstance(item, tuple) and len(item) == 2
+                                and isinstance(item[0], np.ndarray) and item[0].size > 0]
                         
             if not valid_images:
-                viewer._internal_images = [(np.zeros((100, 100, 1), dtype=np.uint8), "Invalid Images")]
+                viewer._internal_images = [(_PLACEHOLDER_IMAGE, "Invalid Images")]
             else:
                 viewer._internal_images = valid_images
             
@@ -1552,18 +1859,23 @@ class ThresholdingWindow:
             viewer.user_image_processor = image_processor_func
             
             # Initialize parameters from trackbar definitions
-            viewer.trackbar.parameters = {}
-            for trackbar_config in viewer.config.trackbar:
-                param_name = trackbar_config.get('param_name')
-                initial_value = trackbar_config.get('initial_value', 0)
-                if param_name:
-                    viewer.trackbar.parameters[param_name] = initial_value
+            viewer.trackbar.parameters = {
+                trackbar_config['param_name']: trackbar_config.get('initial_value', 0)
+                for trackbar_config in viewer.config.trackbar
+                if trackbar_config.get('param_name')
+            }
             
             # Only create windows if debug is enabled
             if viewer.config.enable_debug:
+                # Event constants looked up once, not on every mouse event
+                EVENT_MOUSEWHEEL = cv2.EVENT_MOUSEWHEEL
+                EVENT_FLAG_CTRLKEY = cv2.EVENT_FLAG_CTRLKEY
+                EVENT_MBUTTONDOWN = cv2.EVENT_MBUTTONDOWN
+                EVENT_MBUTTONUP = cv2.EVENT_MBUTTONUP
+                EVENT_MOUSEMOVE = cv2.EVENT_MOUSEMOVE
+                
                 # Create mouse callback for zoom/pan functionality similar to main window
                 def mouse_callback(event, x, y, flags, param):
-                    import cv2  # Import cv2 for event constants
                     try:
                         # Get image dimensions for coordinate transformations
                         if not viewer._internal_images or not viewer.current_image_dims:
@@ -1573,8 +1885,8 @@ class ThresholdingWindow:
                         view_w, view_h = viewer.config.screen_width, viewer.config.screen_height
                         
                         # Convert mouse coordinates to view coordinates (with bounds checking)
-                        x_view = max(0, min(x, view_w - 1))
-                        y_view = max(0, min(y, view_h - 1))
+                        x_view = 0 if x < 0 else (view_w - 1 if x >= view_w else x)
+                        y_view = 0 if y < 0 else (view_h - 1 if y >= view_h else y)
                         
                         # Convert view coordinates to scaled image coordinates
                         x_on_scaled_img = viewer.show_area[0] + x_view
@@ -1586,8 +1898,14 @@ class ThresholdingWindow:
                         ptr_y_orig = int(y_on_scaled_img / current_size_ratio)
                         
                         # Clamp to original image bounds
-                        ptr_x_orig = max(0, min(ptr_x_orig, orig_img_w - 1))
-                        ptr_y_orig = max(0, min(ptr_y_orig, orig_img_h - 1))
+                        if ptr_x_orig < 0:
+                            ptr_x_orig = 0
+                        elif ptr_x_orig >= orig_img_w:
+                            ptr_x_orig = orig_img_w - 1
+                        if ptr_y_orig < 0:
+                            ptr_y_orig = 0
+                        elif ptr_y_orig >= orig_img_h:
+                            ptr_y_orig = orig_img_h - 1
                         
                         # Update mouse position
                         viewer.mouse.mouse_point = [x_view, y_view]
@@ -1595,9 +1913,9 @@ class ThresholdingWindow:
                         viewer.address = f"({ptr_x_orig},{ptr_y_orig})"
                         
                         # Handle zoom functionality (mouse wheel)
-                        if event == cv2.EVENT_MOUSEWHEEL:
+                        if event == EVENT_MOUSEWHEEL:
                             delta = flags
-                            ctrl_key = (flags & cv2.EVENT_FLAG_CTRLKEY) != 0
+                            ctrl_key = (flags & EVENT_FLAG_CTRLKEY) != 0
                             zoom_factor = 1.15 if not ctrl_key else 1.40
                             
                             if delta > 0:
@@ -1620,15 +1938,19 @@ class ThresholdingWindow:
                                 viewer._process_frame_and_check_quit()
                         
                         # Handle pan functionality (middle button drag)
-                        elif event == cv2.EVENT_MBUTTONDOWN:
+                        elif event == EVENT_MBUTTONDOWN:
                             viewer.mouse.is_middle_button_down = True
                             viewer.mouse.middle_button_start = (x_view, y_view)
                             viewer.mouse.middle_button_area_start = (viewer.show_area[0], viewer.show_area[1])
                             
-                        elif event == cv2.EVENT_MBUTTONUP:
+                        elif event == EVENT_MBUTTONUP:
                             viewer.mouse.is_middle_button_down = False
                             
-                        elif (event == cv2.EVENT_MOUSEMOVE and 
+                            # Show the final pan position, which a throttled move may have skipped
+                            if hasattr(viewer, '_process_frame_and_check_quit'):
+                                viewer._process_frame_and_check_quit()
+                            
+                        elif (event == EVENT_MOUSEMOVE and 
                               hasattr(viewer.mouse, 'is_middle_button_down') and viewer.mouse.is_middle_button_down and
                               hasattr(viewer.mouse, 'middle_button_start') and hasattr(viewer.mouse, 'middle_button_area_start')):
                             # Calculate pan delta
@@ -1639,15 +1961,20 @@ class ThresholdingWindow:
                             viewer.show_area[0] = viewer.mouse.middle_button_area_start[0] - dx
                             viewer.show_area[1] = viewer.mouse.middle_button_area_start[1] - dy
                             
-                            # Force display refresh during pan
+                            # Refresh during pan, at most once per PAN_REFRESH_INTERVAL
+                            now = time.monotonic()
+                            if now - viewer._last_refresh_ts < PAN_REFRESH_INTERVAL:
+                                return
+                            viewer._last_refresh_ts = now
                             if hasattr(viewer, '_process_frame_and_check_quit'):
                                 viewer._process_frame_and_check_quit()
                         
                                 
                     except Exception as e:
-                        print(f"Mouse callback error: {e}")
-                        import traceback
-                        traceback.print_exc()
+                        if not viewer._mouse_error_logged:
+                            viewer._mouse_error_logged = True
+                            print(f"Mouse callback error: {e}")
+                            traceback.print_exc()
                 
                 # Create only the windows we need (process + trackbar)
                 viewer.windows.create_windows(mouse_callback, None)
@@ -1655,9 +1982,10 @@ class ThresholdingWindow:
                 # Create trackbars only if windows were created successfully
                 if viewer.windows.windows_created:
                     pass
+                    create_trackbar = viewer.trackbar.create_trackbar
                     for trackbar_config in viewer.config.trackbar:
                         try:
-                            viewer.trackbar.create_trackbar(trackbar_config, viewer)
+                            create_trackbar(trackbar_config, viewer)
                         except Exception as e:
                             print(f"Error creating trackbar {trackbar_config.get('name', 'Unknown')}: {e}")
                 else:
@@ -1672,14 +2000,14 @@ class ThresholdingWindow:
                     if temp_images:
                         viewer._internal_images = temp_images
                     else:
-                        viewer._internal_images = [(np.zeros((100, 100, 1), dtype=np.uint8), "No Images")]
+                        viewer._internal_images = [(_PLACEHOLDER_IMAGE, "No Images")]
                 except Exception as e:
                     print(f"Error in initial image processing: {e}")
-                    viewer._internal_images = [(np.zeros((100, 100, 1), dtype=np.uint8), "Process Error")]
+                    viewer._internal_images = [(_PLACEHOLDER_IMAGE, "Process Error")]
             elif initial_images_for_first_frame:
                 viewer._internal_images = initial_images_for_first_frame
             else:
-                viewer._internal_images = [(np.zeros((100, 100, 1), dtype=np.uint8), "Empty Start")]
+                viewer._internal_images = [(_PLACEHOLDER_IMAGE, "Empty Start")]
             
             pass
             
@@ -1735,7 +2063,7 @@ class ThresholdingWindow:
                 return
                 
             if not viewer._internal_images:
-                viewer._internal_images = [(np.zeros((100, 100, 1), dtype=np.uint8), "No Images")]
+                viewer._internal_images = [(_PLACEHOLDER_IMAGE, "No Images")]
             
             try:
                 # Process the current image and display it with proper scaling and mouse interaction
@@ -1769,9 +2097,10 @@ class ThresholdingWindow:
                     # Silent view reset
                     
             except Exception as e:
-                print(f"Error in process_frame: {e}")
-                import traceback
-                traceback.print_exc()
+                if not viewer._frame_error_logged:
+                    viewer._frame_error_logged = True
+                    print(f"Error in process_frame: {e}")
+                    traceback.print_exc()
                 
         return process_frame_method
         
@@ -1781,7 +2110,13 @@ class ThresholdingWindow:
         
         Creates a method that handles zoom and pan transformations identical
         to the main ImageViewer, providing consistent navigation experience
-        in the threshold preview.
+        in the threshold preview. Instead of resizing the whole image and
+        cropping the view, only the visible pixels are sampled, using the
+        same nearest-neighbour source rows and columns as cv2.resize with
+        INTER_NEAREST. The row/column indices are cached on the viewer and
+        rebuilt only when the zoom, pan or window size changes; the image
+        itself is never cached, since thresholding reuses its output buffers.
+        At zoom 1.0 the visible region is sliced from the image without a copy.
         
         Args:
             viewer: The ImageViewer instance to create the method for.
@@ -1790,13 +2125,20 @@ class ThresholdingWindow:
             callable: Zoom and pan transformation method.
         
         Performance:
-            Time Complexity: O(1) - Direct coordinate transformations.
-            Space Complexity: O(1) - No additional memory allocation.
+            Time Complexity: O(view_w * view_h) per frame, independent of the
+                             zoom level and image size.
+            Space Complexity: O(view_w + view_h) for the cached indices.
         """
+        def display_canvas_for(image, view_w, view_h):
+            # Reuse the previous frame's canvas when size and type still match
+            shape = (view_h, view_w) + image.shape[2:]
+            canvas = viewer._display_canvas
+            if canvas is None or canvas.shape != shape or canvas.dtype != image.dtype:
+                canvas = np.empty(shape, dtype=image.dtype)
+                viewer._display_canvas = canvas
+            return canvas
+        
         def zoom_pan_transform(image):
-            import cv2
-            import numpy as np
-            
             if image is None or image.size == 0:
                 return image
                 
@@ -1824,17 +2166,15 @@ class ThresholdingWindow:
                 target_win_w = max(viewer.config.min_window_size[0], min(scaled_w, max_win_w))
                 target_win_h = max(viewer.config.min_window_size[1], min(scaled_h, max_win_h))
 
+                view_w, view_h = current_win_w, current_win_h
                 if abs(current_win_w - target_win_w) > 1 or abs(current_win_h - target_win_h) > 1 :
                     viewer.windows.resize_process_window(target_win_w, target_win_h)
-                # Get ACTUAL window size after resizing (key difference!)
-                _wx, _wy, view_w, view_h = cv2.getWindowImageRect(viewer.config.process_window_name)
+                    # Get ACTUAL window size after resizing (key difference!)
+                    _wx, _wy, view_w, view_h = cv2.getWindowImageRect(viewer.config.process_window_name)
             except cv2.error: 
                 pass 
             view_w, view_h = max(1, view_w), max(1, view_h)
 
-            # Scale the image (same as main ImageViewer)
-            scaled_image_for_roi = cv2.resize(image, (scaled_w, scaled_h), interpolation=cv2.INTER_NEAREST)
-            
             # Handle viewport clipping with ACTUAL window dimensions
             max_show_x = max(0, scaled_w - view_w)
             max_show_y = max(0, scaled_h - view_h)
@@ -1849,27 +2189,41 @@ class ThresholdingWindow:
             
             if roi_w_actual > 0 and roi_h_actual > 0:
                 try:
-                    viewport_image = scaled_image_for_roi[roi_y_start:roi_y_start + roi_h_actual, 
-                                                        roi_x_start:roi_x_start + roi_w_actual]
+                    if scaled_w == orig_w and scaled_h == orig_h:
+                        # Unscaled: the viewport is a plain slice (a view, no copy)
+                        viewport_image = image[roi_y_start:roi_y_start + roi_h_actual,
+                                               roi_x_start:roi_x_start + roi_w_actual]
+                    else:
+                        # Source pixel of each view pixel, as cv2.resize(INTER_NEAREST) picks it
+                        key = (orig_w, orig_h, scaled_w, scaled_h,
+                               roi_x_start, roi_y_start, roi_w_actual, roi_h_actual)
+                        if viewer._viewport_index is None or viewer._viewport_index[0] != key:
+                            xs = (np.arange(roi_x_start, roi_x_start + roi_w_actual) * (orig_w / scaled_w)).astype(np.intp)
+                            ys = (np.arange(roi_y_start, roi_y_start + roi_h_actual) * (orig_h / scaled_h)).astype(np.intp)
+                            np.minimum(xs, orig_w - 1, out=xs)
+                            np.minimum(ys, orig_h - 1, out=ys)
+                            viewer._viewport_index = (key, ys[:, np.newaxis], xs)
+                        _, rows, cols = viewer._viewport_index
+                        viewport_image = image[rows, cols]
                 except Exception as e:
                     print(f"Viewport extraction error: {e}")
                     return image
                     
-                # Create display canvas with exact viewport dimensions
-                if len(image.shape) == 3:
-                    display_canvas = np.zeros((view_h, view_w, image.shape[2]), dtype=image.dtype)
-                else:
-                    display_canvas = np.zeros((view_h, view_w), dtype=image.dtype)
+                # The sampled viewport already is the display image when it fills the view
+                if roi_w_actual == view_w and roi_h_actual == view_h:
+                    return viewport_image
                 
-                # Place the viewport image in the canvas
-                display_canvas[:viewport_image.shape[0], :viewport_image.shape[1]] = viewport_image
+                # Place the viewport image in the canvas and black out only the uncovered strips
+                display_canvas = display_canvas_for(image, view_w, view_h)
+                display_canvas[:roi_h_actual, :roi_w_actual] = viewport_image
+                display_canvas[:roi_h_actual, roi_w_actual:] = 0
+                display_canvas[roi_h_actual:] = 0
                 return display_canvas
             else:
                 # Return black canvas if no valid viewport
-                if len(image.shape) == 3:
-                    return np.zeros((view_h, view_w, image.shape[2]), dtype=image.dtype)
-                else:
-                    return np.zeros((view_h, view_w), dtype=image.dtype)
+                display_canvas = display_canvas_for(image, view_w, view_h)
+                display_canvas.fill(0)
+                return display_canvas
                     
         return zoom_pan_transform
         
@@ -1892,8 +2246,6 @@ class ThresholdingWindow:
             - Creates nested ThresholdWindowManager class
             - Configures window creation for thresholding needs
         """
-        from types import SimpleNamespace
-        
         class ThresholdWindowManager:
             """
             Custom window manager optimized for thresholding operations.
@@ -2087,26 +2439,318 @@ class ThresholdingWindow:
         Handle parameter changes from trackbars and update threshold display.
         
         Called when any trackbar value changes, triggering an update of the
-        threshold visualization and status display.
+        threshold visualization and status display. When the window has a Tk
+        root, updates are debounced: each change restarts a short timer, so
+        dragging a slider only recomputes the threshold for the latest value.
+        While the slider moves, large images are thresholded on a downscaled
+        proxy; once no change arrived for SETTLE_DELAY_MS the preview is
+        recomputed at full resolution.
         
         Args:
             value: The new parameter value (optional).
         
         Side Effects:
-            - Triggers threshold viewer update
+            - Schedules or triggers threshold viewer update
             - Updates status display
             - Prevents recursive parameter updates
         """
         try:
             if self.threshold_viewer and not self.is_processing:
-                # Force immediate threshold update
-                self.update_threshold()
-                pass
+                if self.root:
+                    # Coalesce a burst of changes into one update
+                    if self._pending_update is not None:
+                        self.root.after_cancel(self._pending_update)
+                    self._pending_update = self.root.after(15, self._run_pending_update)
+                    # OpenCV trackbars report no release, so wait for input to settle
+                    if self._pending_full is not None:
+                        self.root.after_cancel(self._pending_full)
+                    self._pending_full = self.root.after(SETTLE_DELAY_MS, self._run_full_update)
+                else:
+                    self.update_threshold()
         except Exception as e:
             print(f"Error in _on_param_change: {e}")
-            import traceback
             traceback.print_exc()
             
+    def _run_pending_update(self) -> None:
+        """
+        Run the threshold update scheduled by _on_param_change().
+        """
+        self._pending_update = None
+        self._submit_update(preview=True)
+
+    def _run_full_update(self) -> None:
+        """
+        Recompute the preview at full resolution once trackbar input settled.
+        """
+        self._pending_full = None
+        self._submit_update()
+
+    def _cancel_pending_update(self) -> None:
+        """
+        Cancel scheduled trackbar updates, if any.
+        
+        Results of updates already handed to the worker thread are discarded.
+        """
+        self._discard_worker_results()
+        for attr in ('_pending_update', '_pending_full', '_pending_method_change', '_drain_id'):
+            after_id = getattr(self, attr)
+            if after_id is not None:
+                try:
+                    self.root.after_cancel(after_id)
+                except tk.TclError:
+                    pass
+                setattr(self, attr, None)
+
+    def _submit_update(self, preview: bool = False) -> None:
+        """
+        Queue a trackbar-driven update for the worker thread.
+        
+        Reads the trackbar values and a snapshot of the color space and method
+        selection on the Tk thread and hands them to a background thread, so
+        the Tk event loop keeps handling input and repaints while a large image
+        is thresholded. The worker reads nothing else from the window and
+        computes with its own _ThresholdCache, so the Tk thread never waits
+        for it. OpenCV and NumPy release the GIL during the heavy calls. The
+        result is picked up by _drain_results() and displayed on the Tk thread.
+        
+        Args:
+            preview (bool): Threshold a downscaled proxy, see update_threshold().
+        """
+        if not self.threshold_viewer or not self.viewer._internal_images:
+            return
+        current_idx = self.viewer.trackbar.parameters.get('show', 0)
+        if current_idx >= len(self.viewer._internal_images):
+            return
+        source_image = self.viewer._internal_images[current_idx][0]
+        params = dict(self.threshold_viewer.trackbar.parameters)
+        key = self._update_key(params)
+        
+        # Skip if the preview shows, or is about to show, these settings
+        last = self._last_update
+        if (last is not None and last[0] == key and last[1] is source_image
+                and (preview or not last[2])):
+            return
+        submitted = self._submitted
+        if (self._received_generation < self._job_generation and submitted is not None
+                and submitted[0] == key and submitted[1] is source_image
+                and submitted[2] == preview):
+            return
+        
+        self._job_generation += 1
+        self._submitted = (key, source_image, preview)
+        self._job_queue.put((self._job_generation, key, source_image, params,
+                             self._threshold_settings(), preview, self._cache_epoch))
+        
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._threshold_worker,
+                                            args=(_ThresholdCache(),), daemon=True)
+            self._worker.start()
+        if self._drain_id is None:
+            self._drain_id = self.root.after(10, self._drain_results)
+
+    def _threshold_worker(self, cache: _ThresholdCache) -> None:
+        """
+        Worker thread loop computing queued updates until a None job arrives.
+        
+        Only the newest queued update is computed; older ones are superseded.
+        Each result is posted as (generation, key, source image, (thresholded
+        image, used proxy, buffer key), None); a failed update is posted with
+        None in place of the result and the exception last, to be reported
+        on the Tk thread.
+        
+        Args:
+            cache (_ThresholdCache): Caches owned by this thread alone.
+        """
+        while True:
+            job = self._job_queue.get()
+            while job is not None and not self._job_queue.empty():
+                job = self._job_queue.get_nowait()
+            if job is None:
+                break
+            
+            generation, key, source_image, params, settings, preview, epoch = job
+            if cache.epoch != epoch:
+                # Cached data was invalidated on the Tk thread
+                cache.clear()
+                cache.epoch = epoch
+            # Take back outputs the Tk thread has stopped displaying
+            while True:
+                try:
+                    buffer_key, buffer = self._spare_buffers.get_nowait()
+                except queue.Empty:
+                    break
+                cache.buffers[buffer_key] = buffer
+            
+            try:
+                thresholded_image, used_proxy = self._threshold_image(
+                    source_image, params, preview, settings, cache)
+            except Exception as e:
+                self._result_queue.put((generation, key, source_image, None, e))
+                continue
+            # The Tk thread owns the output until it returns it
+            buffer_key = cache.release(thresholded_image)
+            self._result_queue.put((generation, key, source_image,
+                                    (thresholded_image, used_proxy, buffer_key), None))
+
+    def _drain_results(self) -> None:
+        """
+        Display the newest worker result on the Tk thread, polling until it arrives.
+        """
+        self._drain_id = None
+        latest = None
+        while True:
+            try:
+                generation, key, source_image, result, error = self._result_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._received_generation = max(self._received_generation, generation)
+            if error is not None:
+                # Reported like a failed update_threshold() on the Tk thread
+                print(f"Error in update_threshold: {error}")
+                traceback.print_exception(type(error), error, error.__traceback__)
+                continue
+            if latest is not None:
+                self._return_buffer(latest[3])
+            latest = (generation, key, source_image, result)
+        
+        if latest is not None:
+            generation, key, source_image, result = latest
+            if generation == self._job_generation and self.threshold_viewer:
+                thresholded_image, used_proxy, buffer_key = result
+                self._last_update = (key, source_image, used_proxy)
+                self._show_threshold_result(thresholded_image, buffer_key)
+                self._update_status_display()
+            else:
+                self._return_buffer(result)
+        
+        if self._received_generation < self._job_generation and self.root:
+            self._drain_id = self.root.after(10, self._drain_results)
+
+    def _return_buffer(self, result) -> None:
+        """
+        Give the output buffer of a worker result back to the worker thread.
+        
+        Args:
+            result (tuple): (thresholded image, used proxy, buffer key) as
+                           posted by _threshold_worker().
+        """
+        thresholded_image, _, buffer_key = result
+        if buffer_key is not None:
+            self._spare_buffers.put((buffer_key, thresholded_image))
+
+    def _discard_worker_results(self) -> None:
+        """
+        Make results of updates already queued for the worker thread stale.
+        
+        Called when the preview is updated or hidden on the Tk thread, so an
+        older worker result cannot replace it afterwards.
+        """
+        self._job_generation += 1
+        self._received_generation = self._job_generation
+
+    def _stop_worker(self) -> None:
+        """
+        Ask the worker thread, if running, to exit.
+        """
+        if self._worker is not None:
+            self._job_queue.put(None)
+            self._worker = None
+
+    def _threshold_settings(self) -> _ThresholdSettings:
+        """
+        Snapshot the color space, method and channels an update is computed with.
+        
+        Read on the Tk thread. The returned tuple is immutable, so an update
+        computed from it on the worker thread is not affected by selections
+        the user makes in the meantime.
+        
+        Returns:
+            _ThresholdSettings: Color space, thresholding method and the
+                               channel names of the color space.
+        """
+        color_space = self.color_space
+        if self.threshold_method_var:
+            method = self._method
+        else:
+            method = "Simple" if color_space == "Grayscale" else "Range"
+        return _ThresholdSettings(color_space, method, tuple(self.ranges.get(color_space, ())))
+
+    def _update_key(self, params: dict) -> tuple:
+        """
+        Return the settings that determine the thresholded preview.
+        
+        Args:
+            params (dict): Current trackbar values.
+        
+        Returns:
+            tuple: Color space, method, dropdown selections and sorted trackbar values.
+        """
+        return (self.color_space, self.current_method,
+                self._method if self.threshold_method_var else None,
+                self._threshold_type if self.threshold_type_var else None,
+                self._adaptive_method if self.adaptive_method_var else None,
+                tuple(sorted(params.items())))
+
+    def _threshold_image(self, source_image, params: dict, preview: bool,
+                         settings: _ThresholdSettings = None, cache: _ThresholdCache = None):
+        """
+        Threshold source_image, on a downscaled proxy when preview is set.
+        
+        Args:
+            source_image: The source image from the main viewer.
+            params (dict): Trackbar values.
+            preview (bool): Use the proxy from _get_preview() for large images.
+            settings (_ThresholdSettings, optional): See _apply_thresholding().
+            cache (_ThresholdCache, optional): Caches of the calling thread;
+                         _tk_cache when None.
+        
+        Returns:
+            tuple: (thresholded image with the source's height and width,
+                   whether the proxy was used).
+        """
+        if cache is None:
+            cache = self._tk_cache
+        proxy = None
+        if preview:
+            color_space = settings.color_space if settings else self.color_space
+            proxy, proxy_converted = self._get_preview(source_image, color_space, cache)
+        
+        if proxy is None:
+            return self._apply_thresholding(source_image, params, None, settings, cache), False
+        
+        thresholded_proxy = self._apply_thresholding(proxy, params, proxy_converted, settings, cache)
+        # Keep full-size dimensions so zoom and pan stay consistent
+        size = (source_image.shape[1], source_image.shape[0])
+        thresholded_image = self._into("proxy_up", source_image,
+                                       lambda dst: cv2.resize(thresholded_proxy, size, dst=dst,
+                                                              interpolation=cv2.INTER_NEAREST),
+                                       cache)
+        return thresholded_image, True
+
+    def _show_threshold_result(self, thresholded_image, buffer_key=None) -> None:
+        """
+        Put a thresholded image into the threshold viewer and display it.
+        
+        A worker output that was displayed before is given back to the worker
+        thread for reuse once it has been replaced.
+        
+        Args:
+            thresholded_image: The image to show in the preview window.
+            buffer_key (tuple, optional): Worker buffer key of thresholded_image,
+                         None for images computed on the Tk thread.
+        """
+        if self._shown_buffer is not None:
+            self._spare_buffers.put(self._shown_buffer)
+        self._shown_buffer = None if buffer_key is None else (buffer_key, thresholded_image)
+        # Update the threshold viewer's internal images directly
+        self.threshold_viewer._internal_images = [(thresholded_image, f"Thresholded - {self.color_space}")]
+        
+        # Display the new image once, with the viewer's zoom and pan applied
+        if (hasattr(self.threshold_viewer, 'windows') and 
+            self.threshold_viewer.windows.windows_created and 
+            self.threshold_viewer._should_continue_loop):
+            self.threshold_viewer._process_frame_and_check_quit()
+
     def _threshold_processor(self, params: dict, log_func: callable) -> list:
         """
         Process images for the threshold viewer with current parameters.
@@ -2128,7 +2772,7 @@ class ThresholdingWindow:
         """
         """Process images for the threshold viewer."""
         if not self.viewer._internal_images or self.is_processing:
-            return [(np.zeros((100, 100, 1), dtype=np.uint8), "No Image")]
+            return [(_PLACEHOLDER_IMAGE, "No Image")]
             
         self.is_processing = True
         try:
@@ -2137,13 +2781,14 @@ class ThresholdingWindow:
             image, title = self.viewer._internal_images[current_idx]
             
             # Apply thresholding
-            thresholded_image = self._apply_thresholding(image, params)
+            thresholded_image, _ = self._threshold_image(image, params, False)
             
             return [(thresholded_image, f"Thresholded - {self.color_space}")]
         finally:
             self.is_processing = False
             
-    def _apply_thresholding(self, image, params: dict):
+    def _apply_thresholding(self, image, params: dict, converted=None,
+                            settings: _ThresholdSettings = None, cache: _ThresholdCache = None):
         """
         Apply thresholding to the image using current parameters.
         
@@ -2156,6 +2801,15 @@ class ThresholdingWindow:
             params (dict): Dictionary of current parameter values from trackbars.
                           Contains method-specific parameters like threshold values,
                           color channel ranges, and processing options.
+            converted (numpy.ndarray, optional): image already converted to the
+                          color space, e.g. a cached preview conversion.
+                          Converted here when None.
+            settings (_ThresholdSettings, optional): Color space, method and
+                          channels to threshold with. Read from the window when
+                          None; when given, no window state or tkinter variable
+                          is read or set, so the call is safe off the Tk thread.
+            cache (_ThresholdCache, optional): Caches of the calling thread;
+                          _tk_cache when None.
         
         Returns:
             numpy.ndarray: Thresholded image array with same dimensions as input.
@@ -2172,15 +2826,24 @@ class ThresholdingWindow:
             Space Complexity: O(n) for color space conversion and image copies.
         """
         processor = ThresholdProcessor(image)
-        converted_image = processor.convert_color_space(self.color_space)
+        sync_ui = settings is None
+        if sync_ui:
+            settings = self._threshold_settings()
+        if cache is None:
+            cache = self._tk_cache
+        color_space, method, channels = settings
+        if converted is None:
+            converted_image = self._get_converted(image, color_space, cache)
+        else:
+            converted_image = converted
 
-        if self.color_space == "Grayscale":
+        if color_space == "Grayscale":
             # Get parameters
             threshold_value = params.get("threshold", 127)
             max_value = params.get("max_value", 255)
             
             # Get threshold type
-            threshold_types = ["BINARY", "BINARY_INV", "TRUNC", "TOZERO", "TOZERO_INV"]
+            threshold_types = THRESHOLD_TYPES
             type_idx = params.get("threshold_type_idx", 0)
             threshold_type = threshold_types[min(type_idx, len(threshold_types)-1)]
             
@@ -2188,46 +2851,66 @@ class ThresholdingWindow:
             pass
             
             # Update UI combo box if it exists
-            if self.threshold_type_var:
+            if sync_ui and self.threshold_type_var and self._threshold_type != threshold_type:
                 self.threshold_type_var.set(threshold_type)
             
-            method = self.threshold_method_var.get() if self.threshold_method_var else "Simple"
-            
             if method == "Simple":
-                return processor.apply_advanced_threshold(
-                    converted_image, threshold_value, max_value, threshold_type)
+                if converted_image.dtype == np.uint8:
+                    # One table gather instead of a compare/select per pixel
+                    lut = self._threshold_lut(threshold_value, max_value, threshold_type)
+                    return self._into("threshold", converted_image,
+                                      lambda dst: cv2.LUT(converted_image, lut, dst=dst), cache)
+                return self._into("threshold", converted_image,
+                                  lambda dst: processor.apply_advanced_threshold(
+                                      converted_image, threshold_value, max_value, threshold_type,
+                                      dst=dst), cache)
+            elif method in ("Otsu", "Triangle") and converted_image.dtype == np.uint8:
+                # Threshold depends only on the image; trackbar ticks reuse it
+                auto_value = self._auto_threshold(image, converted_image, color_space, method, cache)
+                lut = self._threshold_lut(auto_value, max_value, threshold_type)
+                return self._into("threshold", converted_image,
+                                  lambda dst: cv2.LUT(converted_image, lut, dst=dst), cache)
             elif method == "Otsu":
-                return processor.apply_advanced_threshold(
-                    converted_image, threshold_value, max_value, threshold_type, use_otsu=True)
+                return self._into("threshold", converted_image,
+                                  lambda dst: processor.apply_advanced_threshold(
+                                      converted_image, threshold_value, max_value, threshold_type,
+                                      use_otsu=True, dst=dst), cache)
             elif method == "Triangle":
-                return processor.apply_advanced_threshold(
-                    converted_image, threshold_value, max_value, threshold_type, use_triangle=True)
+                return self._into("threshold", converted_image,
+                                  lambda dst: processor.apply_advanced_threshold(
+                                      converted_image, threshold_value, max_value, threshold_type,
+                                      use_triangle=True, dst=dst), cache)
             elif method == "Adaptive":
                 block_size = params.get("block_size", 11)
                 c_constant = params.get("c_constant", 2)
                 
                 # Get adaptive method
-                adaptive_methods = ["MEAN_C", "GAUSSIAN_C"]
+                adaptive_methods = ADAPTIVE_METHODS
                 method_idx = params.get("adaptive_method_idx", 0)
                 adaptive_method = adaptive_methods[min(method_idx, len(adaptive_methods)-1)]
                 
-                if self.adaptive_method_var:
+                if sync_ui and self.adaptive_method_var and self._adaptive_method != adaptive_method:
                     self.adaptive_method_var.set(adaptive_method)
                 
-                return processor.apply_adaptive_threshold(
-                    converted_image, max_value, adaptive_method, threshold_type, block_size, c_constant)
+                if cv2.ocl.useOpenCL():
+                    # Transparent API: runs on the OpenCL device, result downloaded once
+                    return processor.apply_adaptive_threshold(
+                        self._get_umat(image, converted_image, color_space, cache), max_value, adaptive_method,
+                        threshold_type, block_size, c_constant).get()
+                return self._into("threshold", converted_image,
+                                  lambda dst: processor.apply_adaptive_threshold(
+                                      converted_image, max_value, adaptive_method, threshold_type,
+                                      block_size, c_constant, dst=dst), cache)
             else:
                 return processor.apply_binary_threshold(converted_image, threshold_value, False)
         else:
             # Color space thresholding
-            method = self.threshold_method_var.get() if self.threshold_method_var else "Range"
-            
             # Get threshold type
-            threshold_types = ["BINARY", "BINARY_INV", "TRUNC", "TOZERO", "TOZERO_INV"]
+            threshold_types = THRESHOLD_TYPES
             type_idx = params.get("threshold_type_idx", 0)
             threshold_type = threshold_types[min(type_idx, len(threshold_types)-1)]
             
-            if self.threshold_type_var:
+            if sync_ui and self.threshold_type_var and self._threshold_type != threshold_type:
                 self.threshold_type_var.set(threshold_type)
             
             if method == "Range":
@@ -2235,18 +2918,23 @@ class ThresholdingWindow:
                 lower_bounds = []
                 upper_bounds = []
                 
-                ranges = self.ranges.get(self.color_space, {})
-                for channel in ranges.keys():
+                for channel in channels:
                     lower_bounds.append(params.get(f"{channel.lower()}_min", 0))
                     upper_bounds.append(params.get(f"{channel.lower()}_max", 255))
 
-                return processor.apply_range_threshold(converted_image, lower_bounds, upper_bounds)
+                mask = cache.buffers.get(("mask", converted_image.shape))
+                if mask is None:
+                    mask = self._into("mask", converted_image,
+                                      lambda dst: np.empty(converted_image.shape[:2], np.uint8), cache)
+                return self._into("range", image,
+                                  lambda dst: processor.apply_range_threshold(
+                                      converted_image, lower_bounds, upper_bounds, dst=dst, mask=mask),
+                                  cache)
             else:
                 # Advanced per-channel thresholding
-                ranges = self.ranges.get(self.color_space, {})
                 channel_params = []
                 
-                for channel in ranges.keys():
+                for channel in channels:
                     channel_lower = channel.lower()
                     channel_param = {
                         'threshold': params.get(f"{channel_lower}_threshold", 127),
@@ -2255,11 +2943,11 @@ class ThresholdingWindow:
                     }
                     
                     if method == "Adaptive":
-                        adaptive_methods = ["MEAN_C", "GAUSSIAN_C"]
+                        adaptive_methods = ADAPTIVE_METHODS
                         method_idx = params.get("adaptive_method_idx", 0)
                         adaptive_method = adaptive_methods[min(method_idx, len(adaptive_methods)-1)]
                         
-                        if self.adaptive_method_var:
+                        if sync_ui and self.adaptive_method_var and self._adaptive_method != adaptive_method:
                             self.adaptive_method_var.set(adaptive_method)
                         
                         channel_param.update({
@@ -2278,6 +2966,267 @@ class ThresholdingWindow:
                 
                 return processor.apply_multi_channel_threshold(converted_image, thresholding_params)
 
+    def _into(self, name: str, image, compute: callable, cache: _ThresholdCache):
+        """
+        Run compute with the output array kept from its previous call.
+        
+        OpenCV writes into a dst array of matching shape and dtype instead of
+        allocating, so reusing the last result avoids a full-image allocation
+        per trackbar tick. Buffers are keyed by name and input shape, so the
+        proxy and full-resolution updates keep separate arrays. Each thread
+        has its own buffers; the worker thread releases an output before
+        handing it to the Tk thread, see _threshold_worker().
+        
+        Args:
+            name (str): Which output this is, e.g. "threshold" or "range".
+            image: The input the output is computed from; its shape selects the buffer.
+            compute (callable): Takes the previous output (or None) and returns
+                               the new one.
+            cache (_ThresholdCache): Caches of the calling thread.
+        
+        Returns:
+            numpy.ndarray: The result of compute, stored for the next call.
+        """
+        buffers = cache.buffers
+        key = (name, image.shape)
+        result = compute(buffers.get(key))
+        if key not in buffers and len(buffers) >= 8:
+            # Source size changed; drop buffers of earlier sizes
+            buffers.clear()
+        buffers[key] = result
+        return result
+
+    def _get_umat(self, source, converted, color_space: str, cache: _ThresholdCache):
+        """
+        Return converted as a cv2.UMat, uploading it only when the source changes.
+        
+        Used for Adaptive thresholding when OpenCV has OpenCL enabled, so that
+        trackbar changes on the same image reuse the copy on the device. The
+        upload is keyed on the source image and color space rather than on the
+        converted array, which the conversion caches may replace.
+        
+        Args:
+            source: The image passed to _apply_thresholding(), i.e. the source
+                   image or its preview proxy.
+            converted: source in color_space, single-channel.
+            color_space (str): The color space converted is in.
+            cache (_ThresholdCache): Caches of the calling thread.
+        
+        Returns:
+            cv2.UMat: Device copy of converted.
+        """
+        uploaded = cache.umat_source
+        if uploaded is None or uploaded[0] is not source or uploaded[1] != color_space:
+            cache.umat = cv2.UMat(converted)
+            cache.umat_source = (source, color_space)
+        return cache.umat
+
+    def _auto_threshold(self, source, converted, color_space: str, method: str,
+                        cache: _ThresholdCache) -> int:
+        """
+        Return the Otsu or Triangle threshold of an 8-bit single-channel image.
+        
+        The histogram is computed with np.bincount and the threshold derived
+        from it once per source image and color space; later trackbar updates
+        on the same image (for max value or threshold type) reuse the value
+        instead of letting cv2.threshold rescan the image. The cache is keyed
+        on the source image rather than the converted array, since converted
+        arrays are owned by the conversion caches and may be replaced or
+        supplied by the caller.
+        
+        Args:
+            source: The image passed to _apply_thresholding(), i.e. the source
+                   image or its preview proxy.
+            converted: source in color_space, single-channel uint8.
+            color_space (str): The color space converted is in.
+            method (str): "Otsu" or "Triangle".
+            cache (_ThresholdCache): Caches of the calling thread.
+        
+        Returns:
+            int: The automatic threshold value.
+            
+        Performance:
+            Time Complexity: O(1) on a cache hit, O(n) for a new image.
+            Space Complexity: O(1) - A 256-bin histogram per computation.
+        """
+        auto_thresholds = cache.auto_thresholds
+        key = (id(source), color_space, method)
+        cached = auto_thresholds.get(key)
+        # The source is stored with the value so its id cannot be reused
+        if cached is not None and cached[0] is source:
+            return cached[1]
+        
+        hist = np.bincount(converted.ravel(), minlength=256)
+        if method == "Otsu":
+            value = ThresholdProcessor.compute_otsu_threshold(hist)
+        else:
+            value = ThresholdProcessor.compute_triangle_threshold(hist)
+        
+        if len(auto_thresholds) >= 4:
+            auto_thresholds.clear()
+        auto_thresholds[key] = (source, value)
+        return value
+
+    def _threshold_lut(self, threshold_value: int, max_value: int, threshold_type: str):
+        """
+        Return the lookup table for the given Simple threshold settings.
+        
+        The table is rebuilt only when threshold, max value or type change, so
+        repeated updates with the same settings (e.g. a new source image) reuse it.
+        Key and table are stored as one tuple, so the Tk and worker threads
+        never see a table paired with another thread's key.
+        
+        Args:
+            threshold_value (int): Threshold value.
+            max_value (int): Value assigned by the BINARY types.
+            threshold_type (str): One of "BINARY", "BINARY_INV", "TRUNC",
+                                 "TOZERO", "TOZERO_INV".
+        
+        Returns:
+            numpy.ndarray: 256-entry uint8 lookup table for cv2.LUT.
+        """
+        key = (threshold_value, max_value, threshold_type)
+        cached = self._lut
+        if cached is None or cached[0] != key:
+            cached = (key, self._build_threshold_lut(threshold_value, max_value, threshold_type))
+            self._lut = cached
+        return cached[1]
+
+    @staticmethod
+    def _build_threshold_lut(threshold_value: int, max_value: int, threshold_type: str):
+        """
+        Build a 256-entry table reproducing cv2.threshold on 8-bit images.
+        
+        Args:
+            threshold_value (int): Threshold value; pixels greater than it are "above".
+            max_value (int): Value assigned by the BINARY types, saturated to 0-255.
+            threshold_type (str): One of "BINARY", "BINARY_INV", "TRUNC",
+                                 "TOZERO", "TOZERO_INV". Unknown types use BINARY.
+        
+        Returns:
+            numpy.ndarray: uint8 array of shape (256,) mapping input to output values.
+        
+        Examples:
+            >>> lut = ThresholdingWindow._build_threshold_lut(127, 255, "BINARY")
+            >>> print(lut[127], lut[128])  # 0 255
+            
+        Performance:
+            Time Complexity: O(256) - Independent of image size.
+            Space Complexity: O(256) - One small table.
+        """
+        values = np.arange(256, dtype=np.int32)
+        above = values > int(np.floor(threshold_value))
+        max_value = int(round(max_value))
+        
+        if threshold_type == "BINARY_INV":
+            lut = np.where(above, 0, max_value)
+        elif threshold_type == "TRUNC":
+            lut = np.where(above, int(np.floor(threshold_value)), values)
+        elif threshold_type == "TOZERO":
+            lut = np.where(above, values, 0)
+        elif threshold_type == "TOZERO_INV":
+            lut = np.where(above, 0, values)
+        else:
+            lut = np.where(above, max_value, 0)
+        return np.clip(lut, 0, 255).astype(np.uint8)
+
+    def _get_converted(self, image, color_space: str, cache: _ThresholdCache):
+        """
+        Return image converted to color_space, reusing earlier conversions.
+        
+        Trackbar changes only alter threshold parameters, so the color conversion
+        of an unchanged source image is computed once and reused. Every color
+        space is converted lazily on first use and kept for the source image,
+        so switching back and forth in the color space selector is a dict
+        lookup. When a different source image arrives, the conversions and the
+        values derived from them are dropped. Old conversions are not recycled
+        as cv2.cvtColor output buffers, so an array handed out for one frame
+        is never overwritten with the pixels of the next.
+        
+        Args:
+            image: The source image from the main viewer.
+            color_space (str): The color space to convert to.
+            cache (_ThresholdCache): Caches of the calling thread.
+        
+        Returns:
+            numpy.ndarray: image in color_space. Grayscale images are
+                          returned as-is for the Grayscale color space.
+            
+        Performance:
+            Time Complexity: O(1) on a cache hit, O(n) for a new conversion.
+            Space Complexity: O(n) per color space used, at most len(COLOR_SPACES).
+        """
+        if color_space == "Grayscale" and image.ndim == 2:
+            return image
+        
+        if cache.cvt_source is not image:
+            cache.cvt_cache = {}
+            cache.cvt_source = image
+            # Values derived from the previous source's conversions
+            cache.umat_source = None
+            cache.umat = None
+            cache.auto_thresholds.clear()
+        
+        converted = cache.cvt_cache.get(color_space)
+        if converted is None:
+            converted = ThresholdProcessor(image).convert_color_space(color_space)
+            cache.cvt_cache[color_space] = converted
+        return converted
+
+    def _invalidate_source_caches(self) -> None:
+        """
+        Forget conversions and derived values cached for the current source image.
+        
+        Clears the Tk thread's cache directly; the worker thread clears its
+        own when the next job carries the new _cache_epoch.
+        """
+        self._tk_cache.clear()
+        self._cache_epoch += 1
+        self._last_update = None
+
+    def _get_preview(self, image, color_space: str, cache: _ThresholdCache):
+        """
+        Return a downscaled proxy of image and its color space conversion.
+        
+        Used while a trackbar is being dragged so each tick only processes
+        about PREVIEW_MAX_DIM x PREVIEW_MAX_DIM pixels. The proxy and its
+        conversions are kept until a different source image arrives.
+        
+        Args:
+            image: The source image from the main viewer.
+            color_space (str): The color space to convert the proxy to.
+            cache (_ThresholdCache): Caches of the calling thread.
+        
+        Returns:
+            tuple: (proxy, converted) arrays, or (None, None) if image is
+                  already no larger than PREVIEW_MAX_DIM.
+            
+        Performance:
+            Time Complexity: O(1) on a cache hit, O(n) to build a new proxy.
+            Space Complexity: O(m) where m is the number of proxy pixels.
+        """
+        height, width = image.shape[:2]
+        longest = max(height, width)
+        if longest <= PREVIEW_MAX_DIM:
+            return None, None
+        
+        if cache.proxy_source is not image:
+            scale = PREVIEW_MAX_DIM / longest
+            cache.proxy_image = cv2.resize(image, None, fx=scale, fy=scale,
+                                           interpolation=cv2.INTER_AREA)
+            cache.proxy_source = image
+            cache.proxy_cvt_cache.clear()
+        
+        proxy = cache.proxy_image
+        if color_space == "Grayscale" and proxy.ndim == 2:
+            return proxy, proxy
+        
+        converted = cache.proxy_cvt_cache.get(color_space)
+        if converted is None:
+            converted = ThresholdProcessor(proxy).convert_color_space(color_space)
+            cache.proxy_cvt_cache[color_space] = converted
+        return proxy, converted
+
     def create_trackbars(self) -> None:
         """
         Initialize trackbar definitions and create the initial trackbar set.
@@ -2304,6 +3253,7 @@ class ThresholdingWindow:
         # Recreate the threshold viewer with proper trackbars
         self.threshold_viewer.cleanup_viewer()
         self.threshold_viewer.setup_viewer(image_processor_func=self._threshold_processor)
+        self._last_update = None
         
         # Update trackbar manager reference
         self.trackbar_manager = self.threshold_viewer.trackbar
@@ -2604,28 +3554,28 @@ class ThresholdingWindow:
         """
         """Update UI elements to reflect the selected method."""
         # Show/hide adaptive frame for grayscale
-        if self.color_space == "Grayscale" and hasattr(self, 'adaptive_frame'):
+        # Both windows build threshold_type_combo before the adaptive frames,
+        # and _method_controls is only filled by the legacy window
+        if self.color_space == "Grayscale" and self.adaptive_frame is not None:
             if method == "Adaptive":
                 self.adaptive_frame.pack(padx=10, pady=5, fill="x")
                 # Limit threshold types for adaptive
-                if hasattr(self, 'threshold_type_combo'):
-                    self.threshold_type_combo['values'] = ["BINARY", "BINARY_INV"]
+                self._set_threshold_type_values(ADAPTIVE_THRESHOLD_TYPES)
             else:
                 self.adaptive_frame.pack_forget()
                 # All types available for other methods
-                if hasattr(self, 'threshold_type_combo'):
-                    self.threshold_type_combo['values'] = ["BINARY", "BINARY_INV", "TRUNC", "TOZERO", "TOZERO_INV"]
+                self._set_threshold_type_values(THRESHOLD_TYPES)
         
         # Show/hide adaptive frame for color spaces
-        elif self.color_space != "Grayscale" and hasattr(self, 'advanced_controls_frame'):
+        elif self.color_space != "Grayscale" and self._method_controls:
             if method == "Adaptive":
+                self._ensure_color_advanced_controls()
                 self.advanced_controls_frame.pack(padx=10, pady=5, fill="x")
-                if hasattr(self, 'threshold_type_combo'):
-                    self.threshold_type_combo['values'] = ["BINARY", "BINARY_INV"]
+                self._set_threshold_type_values(ADAPTIVE_THRESHOLD_TYPES)
             else:
-                self.advanced_controls_frame.pack_forget()
-                if hasattr(self, 'threshold_type_combo'):
-                    self.threshold_type_combo['values'] = ["BINARY", "BINARY_INV", "TRUNC", "TOZERO", "TOZERO_INV"]
+                if self.advanced_controls_frame is not None:
+                    self.advanced_controls_frame.pack_forget()
+                self._set_threshold_type_values(THRESHOLD_TYPES)
     
     def _on_threshold_type_change(self, value: int) -> None:
         """
@@ -2644,7 +3594,7 @@ class ThresholdingWindow:
         """
         """Handle threshold type trackbar changes."""
         try:
-            threshold_types = ["BINARY", "BINARY_INV", "TRUNC", "TOZERO", "TOZERO_INV"]
+            threshold_types = THRESHOLD_TYPES
             if self.threshold_type_var and value < len(threshold_types):
                 self.threshold_type_var.set(threshold_types[value])
             
@@ -2659,7 +3609,6 @@ class ThresholdingWindow:
             
         except Exception as e:
             print(f"Error in _on_threshold_type_change: {e}")
-            import traceback
             traceback.print_exc()
     
     def _on_adaptive_method_change(self, value: int) -> None:
@@ -2678,13 +3627,12 @@ class ThresholdingWindow:
         """
         """Handle adaptive method trackbar changes."""
         try:
-            adaptive_methods = ["MEAN_C", "GAUSSIAN_C"]
+            adaptive_methods = ADAPTIVE_METHODS
             if self.adaptive_method_var:
                 self.adaptive_method_var.set(adaptive_methods[value])
             self._on_param_change(value)
         except Exception as e:
             print(f"Error in _on_adaptive_method_change: {e}")
-            import traceback
             traceback.print_exc()
     
     def _on_dropdown_threshold_type_change(self, event=None) -> None:
@@ -2709,7 +3657,7 @@ class ThresholdingWindow:
             
         # Get selected threshold type from dropdown
         selected_type = self.threshold_type_var.get()
-        threshold_types = ["BINARY", "BINARY_INV", "TRUNC", "TOZERO", "TOZERO_INV"]
+        threshold_types = THRESHOLD_TYPES
         
         # Find index of selected type
         try:
@@ -2720,6 +3668,10 @@ class ThresholdingWindow:
         # No need to update trackbar since Thresh Type is now only in UI
         # Threshold type is controlled by UI combobox only
             
+        # Reselecting the current type changes nothing
+        if self.threshold_viewer.trackbar.parameters.get("threshold_type_idx") == type_index:
+            return
+        
         # Update internal parameter
         self.threshold_viewer.trackbar.parameters["threshold_type_idx"] = type_index
         
@@ -2747,7 +3699,7 @@ class ThresholdingWindow:
             
         # Get selected adaptive method from dropdown
         selected_method = self.adaptive_method_var.get()
-        adaptive_methods = ["MEAN_C", "GAUSSIAN_C"]
+        adaptive_methods = ADAPTIVE_METHODS
         
         # Find index of selected method
         try:
@@ -2758,6 +3710,10 @@ class ThresholdingWindow:
         # No need to update trackbar since Adaptive Method is now only in UI
         # Adaptive method is controlled by UI combobox only
             
+        # Reselecting the current method changes nothing
+        if self.threshold_viewer.trackbar.parameters.get("adaptive_method_idx") == method_index:
+            return
+        
         # Update internal parameter
         self.threshold_viewer.trackbar.parameters["adaptive_method_idx"] = method_index
         
@@ -2809,17 +3765,23 @@ class ThresholdingWindow:
         self._switch_to_method(method)
         self.update_threshold()
 
-    def update_threshold(self, _=None) -> None:
+    def update_threshold(self, _=None, preview=False, force=False) -> None:
         """
         Update the thresholding display by triggering the threshold viewer.
         
         Forces an update of the threshold preview by calling the viewer's
         update display method. This ensures the threshold visualization
         reflects current parameter settings. Core method for real-time updates.
+        The update is skipped when the source image, color space, method and
+        trackbar values are all the same as for the preview already shown.
         
         Args:
             _ (optional): Unused parameter for callback compatibility. Allows this
                          method to be used as trackbar callback.
+            preview (bool): Threshold a downscaled proxy of large images and
+                         scale the result back up. Used during trackbar drags.
+            force (bool): Recompute even if nothing changed, dropping cached
+                         conversions, e.g. after the source was modified in place.
         
         Returns:
             None: Updates display as side effect, no return value.
@@ -2850,36 +3812,26 @@ class ThresholdingWindow:
                     # Apply thresholding using current parameters
                     params = dict(self.threshold_viewer.trackbar.parameters)
                     
-                    # Log all parameters for debugging
-                    pass
-                    
-                    thresholded_image = self._apply_thresholding(source_image, params)
-                    
-                    # Update the threshold viewer's internal images directly
-                    self.threshold_viewer._internal_images = [(thresholded_image, f"Thresholded - {self.color_space}")]
+                    # Nothing to do if the preview already shows these settings
+                    key = self._update_key(params)
+                    last = self._last_update
+                    if force:
+                        self._invalidate_source_caches()
+                    elif (last is not None and last[0] == key and last[1] is source_image
+                            and (preview or not last[2])):
+                        return
                     
-                    # Force multiple display refresh attempts
-                    if (hasattr(self.threshold_viewer, 'windows') and 
-                        self.threshold_viewer.windows.windows_created and 
-                        self.threshold_viewer._should_continue_loop):
-                        
-                        # Force immediate display update
-                        self.threshold_viewer._process_frame_and_check_quit()
-                        
-                        # Also try direct imshow
-                        try:
-                            import cv2
-                            cv2.imshow(self.threshold_viewer.config.process_window_name, thresholded_image)
-                            pass
-                        except Exception as e:
-                            print(f"Direct imshow failed: {e}")
+                    thresholded_image, used_proxy = self._threshold_image(
+                        source_image, params, preview)
+                    self._discard_worker_results()
+                    self._last_update = (key, source_image, used_proxy)
+                    self._show_threshold_result(thresholded_image)
             
             # Update status display
             self._update_status_display()
             
         except Exception as e:
             print(f"Error in update_threshold: {e}")
-            import traceback
             traceback.print_exc()
         finally:
             self.is_processing = False
@@ -2922,13 +3874,13 @@ class ThresholdingWindow:
             
         # Get current parameters from threshold viewer
         params = []
-        method = self.threshold_method_var.get() if self.threshold_method_var else "Unknown"
+        method = self._method if self.threshold_method_var else "Unknown"
         
         # Get parameters from threshold viewer's trackbar manager
         viewer_params = self.threshold_viewer.trackbar.parameters if self.threshold_viewer.trackbar else {}
         
         # Threshold type
-        threshold_types = ["BINARY", "BINARY_INV", "TRUNC", "TOZERO", "TOZERO_INV"]
+        threshold_types = THRESHOLD_TYPES
         type_idx = viewer_params.get("threshold_type_idx", 0)
         threshold_type = threshold_types[min(type_idx, len(threshold_types)-1)]
         
@@ -2937,7 +3889,7 @@ class ThresholdingWindow:
         
         if self.color_space == "Grayscale":
             if method == "Adaptive":
-                adaptive_methods = ["MEAN_C", "GAUSSIAN_C"]
+                adaptive_methods = ADAPTIVE_METHODS
                 method_idx = viewer_params.get("adaptive_method_idx", 0)
                 adaptive_method = adaptive_methods[min(method_idx, len(adaptive_methods)-1)]
                 block_size = viewer_params.get("block_size", 11)
@@ -3254,6 +4206,91 @@ class ThresholdingWindow:
         """
         self.close_callback = callback
     
+    def hide(self) -> None:
+        """
+        Hide the thresholding window while keeping the instance reusable.
+        
+        Closes the OpenCV preview and trackbar windows and withdraws the tkinter
+        window (if any), but keeps the threshold viewer, its configuration and
+        the tkinter widgets alive so show() can bring the window back without
+        rebuilding them. OpenCV cannot hide a HighGUI window, so its native
+        windows are closed and recreated by show().
+        
+        Args:
+            None: This method takes no arguments.
+        
+        Returns:
+            None: Hides windows as side effect, no return value.
+        
+        Examples:
+            >>> threshold_window = ThresholdingWindow(viewer, "HSV")
+            >>> threshold_window.create_simple_threshold_viewer()
+            >>> threshold_window.hide()
+            >>> print(threshold_window.window_created)  # False
+            >>> threshold_window.show()
+            >>> # Same instance displayed again
+            
+        Performance:
+            Time Complexity: O(1) - Closes at most two OpenCV windows.
+            Space Complexity: O(1) - Keeps existing viewer and widgets.
+        """
+        self._cancel_pending_update()
+        self._last_update = None
+        
+        if self.threshold_viewer:
+            try:
+                self.threshold_viewer.cleanup_viewer()
+            except Exception as e:
+                print(f"Error hiding threshold viewer: {e}")
+        
+        if self.root:
+            try:
+                self.root.withdraw()
+            except tk.TclError:
+                pass
+        
+        self.window_created = False
+    
+    def show(self) -> None:
+        """
+        Display a window previously hidden with hide(), or raise a visible one.
+        
+        Restores the tkinter window and recreates the OpenCV preview and
+        trackbar windows of the existing threshold viewer, then refreshes the
+        preview from the current source image.
+        
+        Args:
+            None: This method takes no arguments.
+        
+        Returns:
+            None: Shows windows as side effect, no return value.
+        
+        Examples:
+            >>> threshold_window.hide()
+            >>> threshold_window.show()
+            >>> print(threshold_window.window_created)  # True
+            
+        Performance:
+            Time Complexity: O(n) where n is the number of image pixels,
+                           for the refreshed threshold preview.
+            Space Complexity: O(1) - Reuses the existing viewer and widgets.
+        """
+        if self.window_created:
+            if self.root:
+                self.root.lift()
+            return
+        
+        if self.root:
+            self.root.deiconify()
+            self.root.lift()
+        
+        if self.threshold_viewer:
+            self.threshold_viewer.setup_viewer(image_processor_func=self._threshold_processor)
+            self.trackbar_manager = self.threshold_viewer.trackbar
+        
+        self.window_created = True
+        self.update_threshold()
+    
     def destroy_window(self) -> None:
         """
         Clean up and destroy the thresholding window and associated resources.
@@ -3279,6 +4316,9 @@ class ThresholdingWindow:
             Time Complexity: O(1) - Fixed cleanup operations.
             Space Complexity: O(1) - No additional memory allocation during cleanup.
         """
+        self._cancel_pending_update()
+        self._stop_worker()
+        
         # Call close callback before destroying
         if self.close_callback:
             try:
@@ -3296,8 +4336,9 @@ class ThresholdingWindow:
                 if hasattr(self, 'viewer'):
                     print(f"Error cleaning up threshold viewer: {e}")
         
-        # Only destroy tkinter root if it exists (for full UI mode)
-        if self.window_created and hasattr(self, 'root') and self.root:
+        # Only destroy tkinter root if it exists (for full UI mode), including
+        # a window withdrawn by hide()
+        if self.root:
             try:
                 self.root.destroy()
             except: